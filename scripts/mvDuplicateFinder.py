@@ -30,22 +30,50 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Skip escape codes entirely when output is redirected to a file or pipe
+if not sys.stdout.isatty():
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+
+# Compiled once here rather than looked up on every normalize_text call
+NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# Version markers stripped from titles, bare or in parentheses/brackets
+VERSION_WORDS = r'(remaster|remastered|remix|remixed|live|acoustic|demo|radio\s*edit|extended|original|official)'
+VERSION_PATTERNS = [
+    re.compile(r'\s*\b' + VERSION_WORDS + r'\b\s*', re.IGNORECASE),
+    re.compile(r'\s*\(\s*' + VERSION_WORDS + r'\s*\)\s*', re.IGNORECASE),
+    re.compile(r'\s*\[\s*' + VERSION_WORDS + r'\s*\]\s*', re.IGNORECASE),
+]
+
+
 class MusicVideoDuplicateFinder:
     """Find duplicate music videos based on NFO metadata."""
     
-    def __init__(self, parent_dir: str, threshold: float = 0.85):
+    def __init__(self, parent_dir: str, threshold: float = 0.85, csv_file: Optional[str] = None):
         """
         Initialize the duplicate finder.
         
         Args:
             parent_dir: Parent directory to search for NFO files
             threshold: Fuzzy match threshold (0-1, default 0.85)
+            csv_file: Also export NFO metadata to this CSV from the same scan
         """
         self.parent_dir = Path(parent_dir)
         self.threshold = threshold
         self.nfo_files = []
         self.tracks = []
         self.duplicates = defaultdict(list)
+        self.match_scores = {}  # Best match score per NFO path
+        
+        # Reuse the exporter's field extraction on the trees parsed here, so a
+        # maintenance run that wants both outputs walks and parses only once
+        self.csv_exporter = None
+        self.csv_rows = []
+        if csv_file:
+            from mvNfoExporter import NfoExporter
+            self.csv_exporter = NfoExporter(parent_dir, csv_file)
         
     def normalize_text(self, text: str) -> str:
         """
@@ -68,17 +96,12 @@ class MusicVideoDuplicateFinder:
         text = ''.join([c for c in text if not unicodedata.combining(c)])
         
         # Remove special characters and extra whitespace
-        text = re.sub(r'[^\w\s]', ' ', text)
+        text = NON_WORD_RE.sub(' ', text)
         text = ' '.join(text.split())
         
         # Remove common suffixes that indicate versions
-        version_patterns = [
-            r'\s*\b(remaster|remastered|remix|remixed|live|acoustic|demo|radio\s*edit|extended|original|official)\b\s*',
-            r'\s*\(\s*(remaster|remastered|remix|remixed|live|acoustic|demo|radio\s*edit|extended|original|official)\s*\)\s*',
-            r'\s*\[\s*(remaster|remastered|remix|remixed|live|acoustic|demo|radio\s*edit|extended|original|official)\s*\]\s*',
-        ]
-        for pattern in version_patterns:
-            text = re.sub(pattern, ' ', text, flags=re.IGNORECASE)
+        for pattern in VERSION_PATTERNS:
+            text = pattern.sub(' ', text)
         
         # Common replacements
         replacements = {
@@ -95,22 +118,6 @@ class MusicVideoDuplicateFinder:
             
         return text.strip()
     
-    def fuzzy_match(self, text1: str, text2: str) -> float:
-        """
-        Calculate fuzzy match score between two strings.
-        
-        Args:
-            text1: First string
-            text2: Second string
-            
-        Returns:
-            Match score between 0 and 1
-        """
-        norm1 = self.normalize_text(text1)
-        norm2 = self.normalize_text(text2)
-        
-        return SequenceMatcher(None, norm1, norm2).ratio()
-    
     def find_nfo_files(self) -> None:
         """Find all NFO files recursively in parent directory."""
         print(f"\n{Colors.HEADER}Searching for NFO files in: {self.parent_dir}{Colors.ENDC}")
@@ -136,6 +143,11 @@ class MusicVideoDuplicateFinder:
             tree = ET.parse(nfo_path)
             root = tree.getroot()
             
+            if self.csv_exporter:
+                row = self.csv_exporter.extract_from_root(root, nfo_path)
+                if row:
+                    self.csv_rows.append(row)
+            
             # Extract artist and title
             artist_elem = root.find('artist')
             title_elem = root.find('title')
@@ -148,6 +160,8 @@ class MusicVideoDuplicateFinder:
                     return {
                         'artist': artist,
                         'title': title,
+                        'norm_artist': sys.intern(self.normalize_text(artist)),
+                        'norm_title': sys.intern(self.normalize_text(title)),
                         'path': str(nfo_path),
                         'video_path': str(nfo_path.with_suffix('.mp4'))
                     }
@@ -169,59 +183,110 @@ class MusicVideoDuplicateFinder:
         
         print(f"Loaded {Colors.GREEN}{len(self.tracks)}{Colors.ENDC} tracks with metadata")
     
+    def export_csv(self) -> None:
+        """Write the metadata CSV collected while loading tracks."""
+        if not self.csv_rows:
+            print(f"{Colors.WARNING}No valid data found to export{Colors.ENDC}")
+            return
+        
+        self.csv_exporter.write_csv(self.csv_exporter.sort_rows(self.csv_rows))
+    
     def find_duplicates(self) -> None:
         """Find duplicate tracks using fuzzy matching."""
         print(f"\n{Colors.HEADER}Analyzing for duplicates (threshold: {self.threshold:.0%})...{Colors.ENDC}")
         
-        # Compare each track with all others
-        for i, track1 in enumerate(self.tracks):
-            for j, track2 in enumerate(self.tracks[i+1:], start=i+1):
-                # Calculate match scores
-                artist_score = self.fuzzy_match(track1['artist'], track2['artist'])
-                title_score = self.fuzzy_match(track1['title'], track2['title'])
+        tracks = self.tracks
+        count = len(tracks)
+        
+        # Disjoint-set forest over track indices; matching pairs are unioned
+        # so a track can only ever end up in a single group
+        parent = list(range(count))
+        
+        def find_root(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        # Best score seen for each track across all of its matches
+        scores: Dict[int, float] = {}
+        
+        # Tracks with identical normalized artist and title always match, so
+        # union them up front and fuzzy match only the first track of each bucket
+        exact = defaultdict(list)
+        for i, track in enumerate(tracks):
+            exact[(track['norm_artist'], track['norm_title'])].append(i)
+        
+        representatives = []
+        for members in exact.values():
+            representatives.append(members[0])
+            if len(members) > 1:
+                for i in members:
+                    parent[i] = members[0]
+                    scores[i] = 1.0
+        
+        artist_lens = [len(track['norm_artist']) for track in tracks]
+        title_lens = [len(track['norm_title']) for track in tracks]
+        threshold = self.threshold
+        
+        artist_matcher = SequenceMatcher()
+        title_matcher = SequenceMatcher()
+        
+        # Compare each representative with all earlier ones. The later track is
+        # held as the second sequence, which SequenceMatcher indexes, so that
+        # index is built once per track rather than once per pair
+        for position, j in enumerate(representatives):
+            artist_matcher.set_seq2(tracks[j]['norm_artist'])
+            title_matcher.set_seq2(tracks[j]['norm_title'])
+            la_j, lt_j = artist_lens[j], title_lens[j]
+            
+            for i in representatives[:position]:
+                # ratio() can never exceed 2*min(len_a, len_b)/(len_a + len_b), so pairs whose
+                # lengths alone keep the combined score under the threshold
+                # are skipped without running the matchers at all
+                la_i, lt_i = artist_lens[i], title_lens[i]
+                artist_bound = 2 * min(la_i, la_j) / (la_i + la_j) if la_i + la_j else 1.0
+                title_bound = 2 * min(lt_i, lt_j) / (lt_i + lt_j) if lt_i + lt_j else 1.0
+                if (artist_bound * 0.4) + (title_bound * 0.6) < threshold:
+                    continue
+                
+                artist_matcher.set_seq1(tracks[i]['norm_artist'])
+                artist_score = artist_matcher.ratio()
+                
+                # Skip the title comparison when even the best possible title
+                # match could not lift the combined score to the threshold
+                if (artist_score * 0.4) + (title_bound * 0.6) < threshold:
+                    continue
+                
+                title_matcher.set_seq1(tracks[i]['norm_title'])
+                title_score = title_matcher.ratio()
                 
                 # Combined score (weighted average)
                 combined_score = (artist_score * 0.4) + (title_score * 0.6)
                 
                 # Check if it's a duplicate
-                if combined_score >= self.threshold:
-                    # Find which duplicate group these tracks belong to
-                    group_key = None
-                    
-                    # Check if track1 is already in a group
-                    for key, group in self.duplicates.items():
-                        if any(t['path'] == track1['path'] for t in group):
-                            group_key = key
-                            break
-                    
-                    # If not found, check if track2 is in a group
-                    if not group_key:
-                        for key, group in self.duplicates.items():
-                            if any(t['path'] == track2['path'] for t in group):
-                                group_key = key
-                                break
-                    
-                    # If neither is in a group, create a new one
-                    if not group_key:
-                        group_key = f"group_{len(self.duplicates) + 1}"
-                        self.duplicates[group_key].append({
-                            **track1,
-                            'match_score': 1.0
-                        })
-                    
-                    # Add track1 if not already in the group
-                    if not any(t['path'] == track1['path'] for t in self.duplicates[group_key]):
-                        self.duplicates[group_key].append({
-                            **track1,
-                            'match_score': 1.0
-                        })
-                    
-                    # Add track2 if not already in the group
-                    if not any(t['path'] == track2['path'] for t in self.duplicates[group_key]):
-                        self.duplicates[group_key].append({
-                            **track2,
-                            'match_score': combined_score
-                        })
+                if combined_score >= threshold:
+                    root_i, root_j = find_root(i), find_root(j)
+                    if root_i != root_j:
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+                    for k in (i, j):
+                        if combined_score > scores.get(k, 0.0):
+                            scores[k] = combined_score
+        
+        # Collect groups in order of their first track; that track is the original
+        groups = defaultdict(list)
+        for i in range(count):
+            groups[find_root(i)].append(i)
+        
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            
+            # Groups hold the track dicts themselves; scores live alongside
+            group_key = f"group_{len(self.duplicates) + 1}"
+            for position, i in enumerate(members):
+                self.duplicates[group_key].append(tracks[i])
+                self.match_scores[tracks[i]['path']] = 1.0 if position == 0 else scores[i]
     
     def print_duplicates(self) -> None:
         """Print found duplicates in a formatted way."""
@@ -236,10 +301,10 @@ class MusicVideoDuplicateFinder:
             print(f"\n{Colors.WARNING}Duplicate Group {group_num}:{Colors.ENDC}")
             
             # Sort by match score (highest first)
-            tracks.sort(key=lambda x: x['match_score'], reverse=True)
+            tracks.sort(key=lambda x: self.match_scores[x['path']], reverse=True)
             
             for i, track in enumerate(tracks):
-                status = "ORIGINAL" if i == 0 else f"DUPLICATE ({track['match_score']:.0%} match)"
+                status = "ORIGINAL" if i == 0 else f"DUPLICATE ({self.match_scores[track['path']]:.0%} match)"
                 color = Colors.GREEN if i == 0 else Colors.FAIL
                 
                 print(f"\n  {color}[{status}]{Colors.ENDC}")
@@ -278,10 +343,10 @@ class MusicVideoDuplicateFinder:
                 f.write(f"Duplicate Group {group_num}:\n")
                 f.write("-" * 40 + "\n")
                 
-                tracks.sort(key=lambda x: x['match_score'], reverse=True)
+                tracks.sort(key=lambda x: self.match_scores[x['path']], reverse=True)
                 
                 for i, track in enumerate(tracks):
-                    status = "ORIGINAL" if i == 0 else f"DUPLICATE ({track['match_score']:.0%})"
+                    status = "ORIGINAL" if i == 0 else f"DUPLICATE ({self.match_scores[track['path']]:.0%})"
                     f.write(f"\n[{status}]\n")
                     f.write(f"Artist: {track['artist']}\n")
                     f.write(f"Title:  {track['title']}\n")
@@ -310,6 +375,9 @@ class MusicVideoDuplicateFinder:
         # Load track information
         self.load_tracks()
         
+        if self.csv_exporter:
+            self.export_csv()
+        
         if not self.tracks:
             print(f"{Colors.FAIL}No valid tracks found in NFO files{Colors.ENDC}")
             return
@@ -340,6 +408,7 @@ Examples:
   %(prog)s /media/MusicVideos
   %(prog)s /media/MusicVideos --threshold 0.9
   %(prog)s ./videos --export duplicates_report.txt
+  %(prog)s ./videos --csv music_videos.csv
         """
     )
     
@@ -360,6 +429,11 @@ Examples:
         help='Export results to text file'
     )
     
+    parser.add_argument(
+        '--csv',
+        help='Also export NFO metadata to this CSV file (same format as mvNfoExporter) from the same scan'
+    )
+    
     args = parser.parse_args()
     
     # Validate threshold
@@ -373,7 +447,7 @@ Examples:
         sys.exit(1)
     
     # Create finder instance
-    finder = MusicVideoDuplicateFinder(args.directory, args.threshold)
+    finder = MusicVideoDuplicateFinder(args.directory, args.threshold, args.csv)
     
     # Run the process
     finder.run()
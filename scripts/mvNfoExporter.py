@@ -11,9 +11,9 @@ import csv
 import os
 import sys
 import xml.etree.ElementTree as ET
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 # ANSI color codes for terminal output
 class Colors:
@@ -28,6 +28,12 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Skip escape codes entirely when output is redirected to a file or pipe
+if not sys.stdout.isatty():
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+
 class NfoExporter:
     """Export NFO data to CSV format."""
     
@@ -37,16 +43,21 @@ class NfoExporter:
         'genre', 'director', 'tag', 'youtube_url'
     ]
     
-    def __init__(self, parent_dir: str, output_file: str):
+    # Large output buffer so rows reach the disk in few, big writes
+    WRITE_BUFFER_SIZE = 1 << 23
+    
+    def __init__(self, parent_dir: str, output_file: str, sort_output: bool = True):
         """
         Initialize the NFO exporter.
         
         Args:
             parent_dir: Parent directory to search for NFO files
             output_file: Output CSV file path
+            sort_output: Sort rows by artist and title before writing
         """
         self.parent_dir = Path(parent_dir)
         self.output_file = output_file
+        self.sort_output = sort_output
         self.nfo_files = []
         self.stats = {
             'files_found': 0,
@@ -119,36 +130,34 @@ class NfoExporter:
         if sources_elem is None:
             return ""
         
-        successful_urls = []
+        best_ts = ""
+        best_url = ""
         
-        # Collect all successful URLs with their timestamps
-        for url_elem in sources_elem.findall('url'):
+        # Timestamps are ISO 8601 strings written by mvOrganizer/mvReplacer,
+        # which sort lexically in chronological order, so a single max-scan
+        # over the raw strings replaces parsing and sorting them
+        for url_elem in sources_elem.iterfind('url'):
             # Skip failed URLs
             if url_elem.get('failed') == 'true':
                 continue
             
             url_text = url_elem.text.strip() if url_elem.text else None
+            if not url_text:
+                continue
+            
+            # URLs without a usable timestamp rank below any dated URL
             ts_str = url_elem.get('ts', '')
+            if not ts_str[:4].isdigit():
+                ts_str = ""
             
-            if url_text and ts_str:
-                try:
-                    # Parse timestamp
-                    ts = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-                    successful_urls.append((ts, url_text))
-                except ValueError:
-                    # If timestamp parsing fails, include without timestamp
-                    successful_urls.append((datetime.min, url_text))
-            elif url_text:
-                # URL without timestamp
-                successful_urls.append((datetime.min, url_text))
-        
-        # Sort by timestamp (most recent first)
-        successful_urls.sort(reverse=True)
+            if not best_url or ts_str >= best_ts:
+                best_ts = ts_str
+                best_url = url_text
         
         # Return the most recent successful URL
-        return successful_urls[0][1] if successful_urls else ""
+        return best_url
     
-    def extract_nfo_data(self, nfo_path: Path) -> Optional[Dict[str, str]]:
+    def extract_nfo_data(self, nfo_path: Path) -> Optional[Tuple[str, ...]]:
         """
         Extract data from NFO file.
         
@@ -156,63 +165,111 @@ class NfoExporter:
             nfo_path: Path to NFO file
             
         Returns:
-            Dictionary with CSV field values or None if extraction fails
+            Tuple of CSV field values in CSV_FIELDS order or None if extraction fails
         """
         tree = self.parse_nfo(nfo_path)
         if not tree:
             return None
         
-        root = tree.getroot()
+        return self.extract_from_root(tree.getroot(), nfo_path)
+    
+    def extract_from_root(self, root: ET.Element, nfo_path: Path) -> Optional[Tuple[str, ...]]:
+        """
+        Extract data from an already parsed NFO root element.
         
-        # Extract all fields from NFO
-        # Note: 'label' field comes from <studio> element in NFO
-        data = {
-            'year': self.get_element_text(root, 'year'),
-            'artist': self.get_element_text(root, 'artist'),
-            'title': self.get_element_text(root, 'title'),
-            'album': self.get_element_text(root, 'album'),
-            'label': self.get_element_text(root, 'studio'),  # studio element maps to label field
-            'genre': self.get_element_text(root, 'genre'),
-            'director': self.get_element_text(root, 'director'),
-            'tag': self.get_tags_list(root),  # combine multiple tag elements
-            'youtube_url': self.get_most_recent_successful_url(root)
-        }
+        Args:
+            root: Root element of the NFO
+            nfo_path: Path to NFO file, used in messages
+            
+        Returns:
+            Tuple of CSV field values in CSV_FIELDS order or None if artist or title is missing
+        """
+        artist = self.get_element_text(root, 'artist')
+        title = self.get_element_text(root, 'title')
         
         # Only include entries that have at least artist and title
-        if data['artist'] and data['title']:
-            return data
+        if artist and title:
+            # Extract all fields from NFO in CSV_FIELDS order
+            # Note: 'label' field comes from <studio> element in NFO
+            self.stats['files_exported'] += 1
+            return (
+                self.get_element_text(root, 'year'),
+                artist,
+                title,
+                self.get_element_text(root, 'album'),
+                self.get_element_text(root, 'studio'),  # studio element maps to label field
+                self.get_element_text(root, 'genre'),
+                self.get_element_text(root, 'director'),
+                self.get_tags_list(root),  # combine multiple tag elements
+                self.get_most_recent_successful_url(root)
+            )
         else:
             print(f"{Colors.WARNING}Skipping {nfo_path}: Missing artist or title{Colors.ENDC}")
             return None
     
-    def write_csv(self, data_list: List[Dict[str, str]]) -> None:
+    def iter_nfo_data(self) -> Iterator[Tuple[str, ...]]:
+        """
+        Extract data from each NFO file in turn, updating stats and progress.
+        
+        Yields:
+            Row tuples in CSV_FIELDS order for NFOs with artist and title
+        """
+        for i, nfo_file in enumerate(self.nfo_files, 1):
+            # Show progress periodically rather than per file
+            if i % 500 == 0:
+                print(f"Progress: {i}/{len(self.nfo_files)} files processed...")
+            
+            data = self.extract_nfo_data(nfo_file)
+            self.stats['files_processed'] += 1
+            if data:
+                yield data
+    
+    def sort_rows(self, rows: Iterable[Tuple[str, ...]]) -> List[Tuple[str, ...]]:
+        """
+        Sort rows case-insensitively by artist and title.
+        
+        Args:
+            rows: Row tuples in CSV_FIELDS order
+            
+        Returns:
+            Sorted list of row tuples
+        """
+        # Rows are paired with their lowercased (artist, title) sort key
+        records = [((row[1].lower(), row[2].lower()), row) for row in rows]
+        records.sort(key=itemgetter(0))
+        return [row for _, row in records]
+    
+    def write_csv(self, data_list: Iterable[Tuple[str, ...]]) -> None:
         """
         Write data to CSV file with proper escaping for fields containing commas.
         
-        The csv.DictWriter automatically handles quoting fields that contain
+        The csv.writer automatically handles quoting fields that contain
         special characters like commas, quotes, or newlines.
         
+        Rows are written as they are consumed, so a generator can be passed
+        to stream rows to disk without holding the whole export in memory.
+        
         Args:
-            data_list: List of dictionaries containing NFO data
+            data_list: Row tuples in CSV_FIELDS order
         """
         print(f"\n{Colors.HEADER}Writing CSV file: {self.output_file}{Colors.ENDC}")
         
         try:
-            with open(self.output_file, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(self.output_file, 'w', newline='', encoding='utf-8',
+                      buffering=self.WRITE_BUFFER_SIZE) as csvfile:
                 # Configure the writer with QUOTE_MINIMAL to quote fields only when necessary
                 # This ensures fields with commas, quotes, or newlines are properly quoted
-                writer = csv.DictWriter(
+                writer = csv.writer(
                     csvfile,
-                    fieldnames=self.CSV_FIELDS,
                     quoting=csv.QUOTE_MINIMAL,
                     quotechar='"',
                     escapechar=None,
                     doublequote=True  # Use double quotes to escape quotes within fields
                 )
-                writer.writeheader()
+                writer.writerow(self.CSV_FIELDS)
                 writer.writerows(data_list)
             
-            print(f"{Colors.GREEN}✓ Successfully wrote {len(data_list)} entries to CSV{Colors.ENDC}")
+            print(f"{Colors.GREEN}✓ Successfully wrote {self.stats['files_exported']} entries to CSV{Colors.ENDC}")
         except Exception as e:
             print(f"{Colors.FAIL}Error writing CSV file: {e}{Colors.ENDC}")
             sys.exit(1)
@@ -229,21 +286,14 @@ class NfoExporter:
         # Process each file and collect data
         print(f"\n{Colors.HEADER}Processing NFO files...{Colors.ENDC}")
         
-        data_list = []
-        for i, nfo_file in enumerate(self.nfo_files, 1):
-            # Show progress
-            if i % 10 == 0:
-                print(f"Progress: {i}/{len(self.nfo_files)} files processed...")
-            
-            data = self.extract_nfo_data(nfo_file)
-            if data:
-                data_list.append(data)
-                self.stats['files_exported'] += 1
-            
-            self.stats['files_processed'] += 1
+        if not self.sort_output:
+            # Stream rows straight into the CSV as each NFO is parsed
+            self.write_csv(self.iter_nfo_data())
+            self.print_summary()
+            return
         
         # Sort data by artist and title
-        data_list.sort(key=lambda x: (x['artist'].lower(), x['title'].lower()))
+        data_list = self.sort_rows(self.iter_nfo_data())
         
         # Write to CSV
         if data_list:
@@ -284,6 +334,7 @@ Examples:
   %(prog)s /media/MusicVideos
   %(prog)s /media/MusicVideos -o collection.csv
   %(prog)s ./videos --output my_videos.csv
+  %(prog)s /media/MusicVideos --unsorted
         """
     )
     
@@ -298,6 +349,12 @@ Examples:
         help='Output CSV file name (default: music_videos.csv)'
     )
     
+    parser.add_argument(
+        '--unsorted',
+        action='store_true',
+        help='Write rows in directory walk order as they are parsed instead of sorting by artist and title'
+    )
+    
     args = parser.parse_args()
     
     # Validate directory
@@ -306,7 +363,7 @@ Examples:
         sys.exit(1)
     
     # Create exporter instance
-    exporter = NfoExporter(args.directory, args.output)
+    exporter = NfoExporter(args.directory, args.output, sort_output=not args.unsorted)
     
     # Run the export
     exporter.run()
@@ -9,13 +9,17 @@ Recursively searches for .nfo files and cleans up their <sources> elements by:
 """
 
 import argparse
+import contextlib
+import io
 import os
+import re
+import shutil
 import sys
+import tempfile
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
-from collections import defaultdict
+from typing import Dict, Iterator, List, Tuple, Optional, Set
 
 # ANSI color codes for terminal output
 class Colors:
@@ -30,19 +34,66 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Skip escape codes entirely when output is redirected to a file or pipe
+if not sys.stdout.isatty():
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+
+# Attributes stripped from every kept source URL
+STRIPPED_ATTRIBUTES = ('index', 'channel')
+
+# Raw-bytes patterns for the attribute-only fast path in strip_attributes_fast
+SOURCES_BLOCK_RE = re.compile(rb'<sources>(.*?)</sources>', re.DOTALL)
+URL_ELEMENT_RE = re.compile(rb'<url\b([^>]*)>([^<]*)</url>')
+STRIPPED_ATTRIBUTE_RE = re.compile(rb'\s+(?:index|channel)="[^"]*"')
+LEFTOVER_ATTRIBUTE_RE = re.compile(rb'\b(?:index|channel)\s*=')
+
+# Per-file report lines, built once rather than on every processed file
+PROCESSING_LINE = f"\n{Colors.CYAN}Processing: {{}}{Colors.ENDC}"
+SOURCES_REMOVED_LINE = f"  {Colors.WARNING}Removed {{}} duplicate source(s){Colors.ENDC}"
+ATTRIBUTES_REMOVED_LINE = f"  {Colors.WARNING}Removed {{}} attribute(s){Colors.ENDC}"
+FILE_UPDATED_LINE = f"  {Colors.GREEN}✓ File updated{Colors.ENDC}"
+DRY_RUN_UPDATE_LINE = f"  {Colors.BLUE}[DRY RUN] Would update file{Colors.ENDC}"
+
+
 class NfoSourceCleaner:
     """Clean up sources in NFO files."""
     
-    def __init__(self, parent_dir: str, dry_run: bool = False):
+    # NFOs larger than this are pre-checked with a streaming parse
+    STREAM_THRESHOLD = 256 * 1024
+    
+    # Below this many files the process pool costs more than it saves
+    MIN_PARALLEL_FILES = 32
+    
+    # Files handed to a pool worker per task
+    PARALLEL_BATCH_FILES = 64
+    
+    # Serial runs read this many files ahead on a small thread pool
+    READ_AHEAD_FILES = 256
+    READ_AHEAD_THREADS = 16
+    
+    # ElementTree cannot emit standalone="yes", so the declaration is fixed
+    XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    
+    def __init__(self, parent_dir: str, dry_run: bool = False, jobs: Optional[int] = None,
+                 verbose: bool = False):
         """
         Initialize the NFO source cleaner.
         
         Args:
             parent_dir: Parent directory to search for NFO files
             dry_run: If True, show what would be done without making changes
+            jobs: Number of worker processes (default: CPU count, 1 disables the pool)
+            verbose: If True, report every modified file and not just the summary
         """
         self.parent_dir = Path(parent_dir)
         self.dry_run = dry_run
+        self.verbose = verbose
+        
+        # A dry run is a preview, so it always lists what would change
+        self.show_details = verbose or dry_run
+        self.jobs = jobs or os.cpu_count() or 1
         self.nfo_files = []
         self.stats = {
             'files_found': 0,
@@ -57,26 +108,62 @@ class NfoSourceCleaner:
         """Find all NFO files recursively in parent directory."""
         print(f"\n{Colors.HEADER}Searching for NFO files in: {self.parent_dir}{Colors.ENDC}")
         
-        for root, _, files in os.walk(self.parent_dir):
-            for file in files:
-                if file.endswith('.nfo') and file != 'artist.nfo':
-                    self.nfo_files.append(Path(root) / file)
+        self.nfo_files = list(self._scan(str(self.parent_dir)))
         
         self.stats['files_found'] = len(self.nfo_files)
         print(f"Found {Colors.GREEN}{len(self.nfo_files)}{Colors.ENDC} NFO files")
     
-    def parse_nfo(self, nfo_path: Path) -> Optional[ET.ElementTree]:
+    def _scan(self, path: str) -> Iterator[str]:
+        """
+        Recursively yield NFO file paths below a directory.
+        
+        Uses os.scandir directly so the cached DirEntry type information
+        answers the file/directory check without extra stat calls.
+        
+        Args:
+            path: Directory to scan
+            
+        Yields:
+            Path string of each NFO file, excluding artist.nfo
+        """
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    
+                    # Slice compare avoids a method call per entry; the
+                    # suffix test comes first since most entries fail it
+                    name = entry.name
+                    if name[-4:] == '.nfo' and name != 'artist.nfo':
+                        yield entry.path
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            return
+        
+        # Descend after the files of this directory, matching os.walk order
+        for subdir in subdirs:
+            yield from self._scan(subdir)
+    
+    def parse_nfo(self, nfo_path: str, data: Optional[bytes] = None) -> Optional[ET.ElementTree]:
         """
         Parse NFO file and return the tree.
         
         Args:
             nfo_path: Path to NFO file
+            data: File contents if already read, to avoid reading it again
             
         Returns:
             ElementTree or None if parse fails
         """
         try:
-            tree = ET.parse(nfo_path)
+            if data is not None:
+                # Feed the bytes already in memory to the parser in one call
+                tree = ET.ElementTree(ET.fromstring(data))
+            else:
+                tree = ET.parse(nfo_path)
             return tree
         except ET.ParseError as e:
             print(f"{Colors.WARNING}Warning: Could not parse {nfo_path}: {e}{Colors.ENDC}")
@@ -87,6 +174,115 @@ class NfoSourceCleaner:
             self.stats['errors'] += 1
             return None
     
+    def may_need_cleaning(self, data: bytes) -> bool:
+        """
+        Check the raw bytes of an NFO for anything clean_sources could change.
+        
+        A file needs cleaning only if it has an index or channel attribute or
+        a repeated URL, which takes at least two url elements. The check is a
+        plain substring scan, so it can give false positives but never false
+        negatives.
+        
+        Args:
+            data: Raw contents of the NFO file
+            
+        Returns:
+            True if the file should be parsed and cleaned
+        """
+        if b'<sources' not in data:
+            return False
+        
+        return data.count(b'<url') > 1 or b'index' in data or b'channel' in data
+    
+    def strip_attributes_fast(self, data: bytes) -> Optional[Tuple[bytes, int]]:
+        """
+        Strip index and channel attributes from the raw bytes of an NFO.
+        
+        Most cleanups only remove these attributes from otherwise unique
+        URLs, which needs no parse or re-serialization. The fast path is
+        only taken when the sources block has a simple shape that the
+        regexes fully understand: one block, plain url elements, no
+        entities and no duplicate URLs. Anything else returns None so the
+        file goes through clean_sources.
+        
+        Args:
+            data: Raw contents of the NFO file
+            
+        Returns:
+            Tuple of (new_bytes, attributes_removed) or None if the file
+            needs the full parse
+        """
+        if data.count(b'<sources') != 1:
+            return None
+        
+        match = SOURCES_BLOCK_RE.search(data)
+        if not match:
+            return None
+        
+        block = match.group(1)
+        urls = URL_ELEMENT_RE.findall(block)
+        if len(urls) != block.count(b'<url') or b'&' in block:
+            return None
+        
+        # URLs without text are ignored by clean_sources, so they are left alone here too
+        url_texts = [text.strip() for _, text in urls if text]
+        if len(url_texts) != len(set(url_texts)):
+            return None
+        
+        attributes_removed = 0
+        
+        def strip(url_match):
+            nonlocal attributes_removed
+            attrs, text = url_match.group(1), url_match.group(2)
+            if not text:
+                return url_match.group(0)
+            attrs, count = STRIPPED_ATTRIBUTE_RE.subn(b'', attrs)
+            attributes_removed += count
+            return b'<url' + attrs + b'>' + text + b'</url>'
+        
+        new_block = URL_ELEMENT_RE.sub(strip, block)
+        
+        # Attributes in a form the regex does not handle, such as single quotes
+        for attrs, text in URL_ELEMENT_RE.findall(new_block):
+            if text and LEFTOVER_ATTRIBUTE_RE.search(attrs):
+                return None
+        
+        return data[:match.start(1)] + new_block + data[match.end(1):], attributes_removed
+    
+    def sources_need_cleaning(self, nfo_path: str) -> bool:
+        """
+        Check with a streaming parse whether an NFO has anything to clean.
+        
+        Elements are cleared as soon as they have been inspected, so a large
+        NFO is never held in memory in full. The check is conservative: it
+        may report True for a file that turns out to be clean, but never
+        False for one that clean_sources would modify.
+        
+        Args:
+            nfo_path: Path to NFO file
+            
+        Returns:
+            True if the file should be fully parsed and cleaned
+        """
+        seen_urls = set()
+        try:
+            for _, elem in ET.iterparse(nfo_path):
+                if elem.tag == 'url':
+                    if 'index' in elem.attrib or 'channel' in elem.attrib:
+                        return True
+                    
+                    url_text = elem.text.strip() if elem.text else ''
+                    if url_text in seen_urls:
+                        return True
+                    seen_urls.add(url_text)
+                
+                elem.clear()
+        except Exception:
+            # Let the full parse report the problem
+            return True
+        
+        return False
+    
     def clean_sources(self, root: ET.Element) -> Tuple[bool, int, int]:
         """
         Clean up sources element in the NFO.
@@ -101,132 +297,229 @@ class NfoSourceCleaner:
         if sources_elem is None:
             return False, 0, 0
         
-        was_modified = False
-        sources_removed = 0
-        attributes_removed = 0
+        # Best element so far for each URL text, with its priority
+        keepers = {}
+        losers = []
         
-        # Track URLs and their properties
-        url_data = defaultdict(list)
-        
-        # Collect all URL elements
-        url_elements = sources_elem.findall('url')
-        
-        # Group URLs by their text content
-        for url_elem in url_elements:
-            if url_elem.text:
-                url_text = url_elem.text.strip()
-                url_data[url_text].append(url_elem)
-        
-        # Process each unique URL
-        for url_text, elements in url_data.items():
-            if len(elements) > 1:
-                # Handle duplicates
-                # Check if any have failed=true
-                failed_elem = None
-                search_elem = None
-                other_elem = None
-                
-                for elem in elements:
-                    if elem.get('failed') == 'true':
-                        failed_elem = elem
-                    elif elem.get('search') == 'true':
-                        search_elem = elem
-                    else:
-                        other_elem = elem
-                
-                # Keep the most informative version
-                # Priority: failed > search > other
-                if failed_elem is not None:
-                    keep_elem = failed_elem
-                elif search_elem is not None:
-                    keep_elem = search_elem
-                else:
-                    keep_elem = other_elem or elements[0]
-                
-                # Remove duplicates
-                for elem in elements:
-                    if elem != keep_elem:
-                        sources_elem.remove(elem)
-                        sources_removed += 1
-                        was_modified = True
-                
-                # Clean attributes from the kept element
-                for attr in ['index', 'channel']:
-                    if attr in keep_elem.attrib:
-                        del keep_elem.attrib[attr]
-                        attributes_removed += 1
-                        was_modified = True
+        for url_elem in sources_elem.findall('url'):
+            if not url_elem.text:
+                continue
+            url_text = url_elem.text.strip()
+            
+            # Keep the most informative version
+            # Priority: failed > search > other
+            attrib = url_elem.attrib
+            if attrib.get('failed') == 'true':
+                priority = 2
+            elif attrib.get('search') == 'true':
+                priority = 1
+            else:
+                priority = 0
+            
+            kept = keepers.get(url_text)
+            if kept is None:
+                keepers[url_text] = (priority, url_elem)
+            elif priority > kept[0] or (priority == kept[0] and priority > 0):
+                # Among equals the last failed or search version wins,
+                # while plain duplicates keep the first one
+                losers.append(kept[1])
+                keepers[url_text] = (priority, url_elem)
             else:
-                # Single URL - just clean attributes
-                elem = elements[0]
-                for attr in ['index', 'channel']:
-                    if attr in elem.attrib:
-                        del elem.attrib[attr]
-                        attributes_removed += 1
-                        was_modified = True
+                losers.append(url_elem)
+        
+        # Remove duplicates by rebuilding the children once; each remove()
+        # call would rescan the whole list
+        if losers:
+            loser_ids = {id(elem) for elem in losers}
+            sources_elem[:] = [child for child in sources_elem if id(child) not in loser_ids]
+        sources_removed = len(losers)
+        
+        # Clean attributes from the kept elements
+        attributes_removed = 0
+        for _, elem in keepers.values():
+            attrib = elem.attrib
+            for attr in STRIPPED_ATTRIBUTES:
+                if attrib.pop(attr, None) is not None:
+                    attributes_removed += 1
+        
+        was_modified = sources_removed > 0 or attributes_removed > 0
         
         return was_modified, sources_removed, attributes_removed
     
-    def write_nfo(self, nfo_path: Path, tree: ET.ElementTree) -> None:
-        """Write NFO file with pretty printing."""
-        root = tree.getroot()
+    def write_nfo(self, nfo_path: str, tree: ET.ElementTree,
+                  original: Optional[bytes] = None) -> None:
+        """
+        Write NFO file with pretty printing.
         
-        # Convert to string with pretty printing
-        rough_string = ET.tostring(root, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
+        The file is written to a temporary file in the same directory and
+        moved over the original, so an interrupted write cannot leave a
+        truncated NFO behind.
         
-        # Add XML declaration
-        xml_str = reparsed.toprettyxml(indent="    ", encoding=None)
+        Args:
+            nfo_path: Path to NFO file
+            tree: Cleaned tree to write
+            original: On-disk bytes of the file, if already read; the write
+                is skipped when the new serialization is identical
+        """
+        # Indent the tree in place instead of reparsing it with minidom
+        ET.indent(tree, space="    ")
+        
+        new_bytes = (self.XML_DECLARATION + ET.tostring(tree.getroot(), encoding='unicode')).encode('utf-8')
+        if new_bytes == original:
+            return
         
-        # Fix the declaration
-        lines = xml_str.split('\n')
-        lines[0] = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        self.replace_file(nfo_path, new_bytes)
+    
+    def replace_file(self, nfo_path: str, new_bytes: bytes) -> None:
+        """
+        Atomically replace a file's contents, keeping its permissions.
         
-        # Remove empty lines
-        lines = [line for line in lines if line.strip()]
+        Args:
+            nfo_path: Path to NFO file
+            new_bytes: New file contents
+        """
+        directory, name = os.path.split(nfo_path)
+        with tempfile.NamedTemporaryFile(dir=directory or '.', prefix=f'.{name}.',
+                                         suffix='.tmp', delete=False) as f:
+            f.write(new_bytes)
         
-        with open(nfo_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        try:
+            # Keep the original file's permissions rather than the temp file's 0600
+            shutil.copymode(nfo_path, f.name)
+            os.replace(f.name, nfo_path)
+        except OSError:
+            os.unlink(f.name)
+            raise
     
-    def process_nfo(self, nfo_path: Path) -> None:
+    def read_nfo(self, nfo_path: str) -> Tuple[bool, Optional[bytes]]:
+        """
+        Read a small NFO file in full.
+        
+        Args:
+            nfo_path: Path to NFO file
+            
+        Returns:
+            Tuple of (is_large, data). Large files are not read, and data is
+            None for them or when the file could not be read.
+        """
+        try:
+            if os.path.getsize(nfo_path) > self.STREAM_THRESHOLD:
+                return True, None
+            with open(nfo_path, 'rb') as f:
+                return False, f.read()
+        except OSError:
+            # Leave reporting the problem to parse_nfo
+            return False, None
+    
+    def process_nfo(self, nfo_path: str, preread: Optional[Tuple[bool, Optional[bytes]]] = None) -> None:
         """
         Process a single NFO file.
         
         Args:
             nfo_path: Path to NFO file
+            preread: Result of read_nfo for this file, if already read ahead
         """
-        tree = self.parse_nfo(nfo_path)
-        if not tree:
+        is_large, data = preread if preread is not None else self.read_nfo(nfo_path)
+        
+        # Skip parsing NFOs that are already clean. Large files are checked
+        # with a streaming parse; small ones are scanned as bytes
+        if is_large:
+            if not self.sources_need_cleaning(nfo_path):
+                self.stats['files_processed'] += 1
+                return
+        elif data is not None and not self.may_need_cleaning(data):
+            self.stats['files_processed'] += 1
             return
         
-        root = tree.getroot()
-        was_modified, sources_removed, attributes_removed = self.clean_sources(root)
+        # Files that only need attributes stripped are edited as raw bytes
+        fast_result = self.strip_attributes_fast(data) if data is not None else None
+        if fast_result is not None:
+            tree = None
+            new_data, attributes_removed = fast_result
+            sources_removed = 0
+            was_modified = attributes_removed > 0
+        else:
+            tree = self.parse_nfo(nfo_path, data)
+            if not tree:
+                return
+            
+            root = tree.getroot()
+            was_modified, sources_removed, attributes_removed = self.clean_sources(root)
         
         if was_modified:
-            relative_path = nfo_path.relative_to(self.parent_dir)
+            # Report lines for this file go out in a single write
+            messages = []
+            show_details = self.show_details
             
-            if sources_removed > 0 or attributes_removed > 0:
-                print(f"\n{Colors.CYAN}Processing: {relative_path}{Colors.ENDC}")
+            if show_details and (sources_removed > 0 or attributes_removed > 0):
+                messages.append(PROCESSING_LINE.format(os.path.relpath(nfo_path, self.parent_dir)))
                 
                 if sources_removed > 0:
-                    print(f"  {Colors.WARNING}Removed {sources_removed} duplicate source(s){Colors.ENDC}")
-                    self.stats['sources_removed'] += sources_removed
+                    messages.append(SOURCES_REMOVED_LINE.format(sources_removed))
                 
                 if attributes_removed > 0:
-                    print(f"  {Colors.WARNING}Removed {attributes_removed} attribute(s){Colors.ENDC}")
-                    self.stats['attributes_removed'] += attributes_removed
+                    messages.append(ATTRIBUTES_REMOVED_LINE.format(attributes_removed))
+            
+            self.stats['sources_removed'] += sources_removed
+            self.stats['attributes_removed'] += attributes_removed
             
             if not self.dry_run:
                 # Write the modified file
-                self.write_nfo(nfo_path, tree)
-                print(f"  {Colors.GREEN}✓ File updated{Colors.ENDC}")
+                if tree is None:
+                    self.replace_file(nfo_path, new_data)
+                else:
+                    self.write_nfo(nfo_path, tree, data)
+                if show_details:
+                    messages.append(FILE_UPDATED_LINE)
             else:
-                print(f"  {Colors.BLUE}[DRY RUN] Would update file{Colors.ENDC}")
+                messages.append(DRY_RUN_UPDATE_LINE)
+            
+            if messages:
+                sys.stdout.write('\n'.join(messages) + '\n')
             
             self.stats['files_modified'] += 1
         
         self.stats['files_processed'] += 1
     
+    def process_serial(self) -> None:
+        """
+        Process NFO files in this process, reading ahead on a thread pool.
+        
+        File reads release the GIL, so a few threads overlap the open and
+        read latency of upcoming files with the parsing of the current one.
+        Reads are issued in bounded windows to cap memory on huge libraries.
+        """
+        with ThreadPoolExecutor(max_workers=self.READ_AHEAD_THREADS) as executor:
+            for start in range(0, len(self.nfo_files), self.READ_AHEAD_FILES):
+                batch = self.nfo_files[start:start + self.READ_AHEAD_FILES]
+                for nfo_file, preread in zip(batch, executor.map(self.read_nfo, batch)):
+                    self.process_nfo(nfo_file, preread)
+    
+    def process_parallel(self) -> None:
+        """
+        Process NFO files across a pool of worker processes.
+        
+        Each file is independent, so workers run process_nfo on their own
+        cleaner instance over a batch of files and hand back the batch's
+        totals and printed output. Stats are merged once per batch rather
+        than once per file, and results arrive in input order, so the
+        output matches a serial run.
+        """
+        batch_size = self.PARALLEL_BATCH_FILES
+        batches = [self.nfo_files[start:start + batch_size]
+                   for start in range(0, len(self.nfo_files), batch_size)]
+        
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_worker,
+            initargs=(str(self.parent_dir), self.dry_run, self.verbose)
+        ) as executor:
+            for stats, output in executor.map(_process_in_worker, batches):
+                if output:
+                    sys.stdout.write(output)
+                for key, value in stats.items():
+                    self.stats[key] += value
+    
     def show_example_before_after(self) -> None:
         """Show an example of what the cleaning does."""
         print(f"\n{Colors.HEADER}Example of cleaning:{Colors.ENDC}")
@@ -264,8 +557,10 @@ class NfoSourceCleaner:
         # Process each file
         print(f"\n{Colors.HEADER}Processing NFO files...{Colors.ENDC}")
         
-        for nfo_file in self.nfo_files:
-            self.process_nfo(nfo_file)
+        if self.jobs > 1 and len(self.nfo_files) >= self.MIN_PARALLEL_FILES:
+            self.process_parallel()
+        else:
+            self.process_serial()
         
         # Print summary
         self.print_summary()
@@ -287,6 +582,37 @@ class NfoSourceCleaner:
         print("=" * 60)
 
 
+# Cleaner owned by each worker process, set up once by _init_worker
+_worker_cleaner: Optional[NfoSourceCleaner] = None
+
+
+def _init_worker(parent_dir: str, dry_run: bool, verbose: bool) -> None:
+    """Create the per-process cleaner used by _process_in_worker."""
+    global _worker_cleaner
+    _worker_cleaner = NfoSourceCleaner(parent_dir, dry_run, jobs=1, verbose=verbose)
+
+
+def _process_in_worker(nfo_paths: List[str]) -> Tuple[Dict[str, int], str]:
+    """
+    Process a batch of NFO files inside a worker process.
+    
+    Args:
+        nfo_paths: Paths to NFO files
+        
+    Returns:
+        Tuple of (stats totals for the batch, captured console output)
+    """
+    cleaner = _worker_cleaner
+    cleaner.stats = dict.fromkeys(cleaner.stats, 0)
+    
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        for nfo_path in nfo_paths:
+            cleaner.process_nfo(nfo_path)
+    
+    return cleaner.stats, output.getvalue()
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -319,7 +645,13 @@ Examples:
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
-        help='Show detailed processing information'
+        help='List every modified file (always on for --dry-run)'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Number of worker processes (default: CPU count, 1 to process serially)'
     )
     
     args = parser.parse_args()
@@ -330,7 +662,7 @@ Examples:
         sys.exit(1)
     
     # Create cleaner instance
-    cleaner = NfoSourceCleaner(args.directory, args.dry_run)
+    cleaner = NfoSourceCleaner(args.directory, args.dry_run, args.jobs, args.verbose)
     
     # Run the process
     cleaner.run()
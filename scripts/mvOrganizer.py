@@ -8,19 +8,31 @@ using CSV input. Output is structured for Kodi media center compatibility.
 
 import argparse
 import csv
+import functools
+import hashlib
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import threading
+import unicodedata
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
+# Searching in-process avoids starting a yt-dlp interpreter per row; the
+# yt-dlp executable is used when the Python package is not importable
+try:
+    import yt_dlp
+except ImportError:
+    yt_dlp = None
+
 # ANSI color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -34,17 +46,102 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Patterns used per CSV row, compiled once
+NON_WORD_RE = re.compile(r'[^\w\s]')
+MULTI_UNDERSCORE_RE = re.compile(r'_+')
+YEAR_RE = re.compile(r'^\d{4}$')
+
+# Hosts accepted as YouTube URLs; watch URLs use all but the short-link host
+YOUTUBE_WATCH_HOSTS = frozenset({'www.youtube.com', 'youtube.com', 'm.youtube.com'})
+YOUTUBE_HOSTS = YOUTUBE_WATCH_HOSTS | {'youtu.be'}
+
+# URL prefixes that always have one of YOUTUBE_HOSTS as their host
+YOUTUBE_URL_PREFIXES = tuple(
+    f'{scheme}://{host}/' for scheme in ('https', 'http') for host in sorted(YOUTUBE_HOSTS)
+)
+
+# ASCII equivalent of NON_WORD_RE removal plus the space-to-underscore step,
+# derived from the regex itself so both paths always agree
+ASCII_FILENAME_TABLE = str.maketrans({
+    **{chr(i): None for i in range(128) if NON_WORD_RE.match(chr(i))},
+    ' ': '_'
+})
+
+
+# Artists repeat across many rows, so results are cached; the function is
+# pure, which also keeps the cache safe to share between --jobs threads
+@functools.lru_cache(maxsize=4096)
+def normalize_filename(text: str) -> str:
+    """
+    Normalize filename by converting to lowercase, removing special characters (including hyphens) and replacing spaces.
+    
+    Args:
+        text: Input text to normalize
+        
+    Returns:
+        Normalized filename safe for filesystem (lowercase, no special chars)
+    """
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Normalize unicode characters (e.g., ä -> a). ASCII text is already in
+    # NFKD form with no combining marks, so it skips both passes
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join([c for c in text if not unicodedata.combining(c)])
+    
+    # Remove special characters except alphanumeric, spaces, and underscores,
+    # then replace spaces with underscores. ASCII text does both in a single
+    # translate pass. Note: hyphens are now removed as well
+    if text.isascii():
+        text = text.translate(ASCII_FILENAME_TABLE)
+    else:
+        text = NON_WORD_RE.sub('', text)
+        text = text.replace(' ', '_')
+    
+    # Remove multiple underscores; most names have no runs to collapse, and a
+    # substring check is far cheaper than a regex pass that changes nothing
+    if '__' in text:
+        text = MULTI_UNDERSCORE_RE.sub('_', text)
+    
+    return text.strip('_')
+
+
 class MusicVideoOrganizer:
     """Main class for organizing music videos from CSV input."""
     
+    # ElementTree cannot emit standalone="yes", so the declaration is fixed
+    XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    
+    # Candidate CSV delimiters, in tie-break order
+    DELIMITERS = (',', ';', '\t', '|')
+    
+    # Output directories with at least this many artists are scanned on a
+    # thread pool of SCAN_THREADS workers
+    MIN_PARALLEL_SCAN_DIRS = 64
+    SCAN_THREADS = 16
+    
+    # Outcome of every yt-dlp search and download, kept across runs in the
+    # user's cache directory so nothing extra lands in the library
+    CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mvorganizer'
+    
     def __init__(self, output_dir: str, overwrite: bool = False,
                  no_search: bool = False, cookies: Optional[str] = None,
-                 force_download: bool = False):
+                 force_download: bool = False, jobs: int = 1,
+                 retry_failed: bool = False, failed_ttl_days: float = 7):
         self.output_dir = Path(output_dir)
+        # Per-row paths are built as plain strings with os.path.join, which
+        # is much cheaper than pathlib's / operator
+        self.output_dir_str = str(self.output_dir)
         self.overwrite = overwrite
         self.no_search = no_search
         self.cookies = cookies
         self.force_download = force_download
+        self.jobs = max(1, jobs)
+        # Latest accepted year, fixed for the run rather than read per row
+        self.max_year = datetime.now().year + 1
+        self.retry_failed = retry_failed or force_download
+        self.failed_ttl = failed_ttl_days * 86400
         self.stats = {
             'processed': 0,
             'downloaded': 0,
@@ -53,6 +150,152 @@ class MusicVideoOrganizer:
             'nfo_created': 0
         }
         
+        # Rows may run on worker threads (--jobs), so shared state is locked
+        self._stats_lock = threading.Lock()
+        self._path_locks = defaultdict(threading.Lock)
+        self._path_locks_lock = threading.Lock()
+        
+        # One in-process yt-dlp search client per thread
+        self._search_clients = threading.local()
+        
+        # Paths known to exist under output_dir, preloaded by preload_existing()
+        # so per-row existence checks need no stat calls. set.add is atomic,
+        # so worker threads can record new files without a lock
+        self._existing = set()
+        self._artist_dirs = set()
+        
+        # Results of earlier searches and downloads, so reruns skip yt-dlp
+        # for URLs that already failed and queries that were already answered
+        cache_key = os.path.abspath(self.output_dir_str)
+        self.url_cache_path = self.CACHE_DIR / f"{hashlib.sha1(cache_key.encode('utf-8')).hexdigest()}.json"
+        self._url_cache = self.load_url_cache()
+        self._url_cache_lock = threading.Lock()
+        self._url_cache_dirty = False
+    
+    def increment_stat(self, key: str) -> None:
+        """Increment a summary counter; safe to call from worker threads."""
+        with self._stats_lock:
+            self.stats[key] += 1
+    
+    def path_lock(self, path: str) -> threading.Lock:
+        """
+        Get the lock guarding work on a single output path.
+        
+        Rows for the same artist share artist.nfo, and duplicate rows share
+        the same video and NFO, so those writes must not run concurrently.
+        """
+        with self._path_locks_lock:
+            return self._path_locks[path]
+    
+    def preload_existing(self) -> None:
+        """
+        Record every artist directory and file already in the output directory.
+        
+        One scandir pass over the two-level artist/title layout replaces the
+        stat calls process_video would otherwise make for every row.
+        """
+        self._existing.clear()
+        self._artist_dirs.clear()
+        
+        try:
+            with os.scandir(self.output_dir) as it:
+                artist_paths = [entry.path for entry in it if entry.is_dir()]
+        except FileNotFoundError:
+            return
+        
+        self._artist_dirs.update(artist_paths)
+        
+        # On network mounts each directory listing is a round trip, so large
+        # libraries list artist directories concurrently
+        if len(artist_paths) >= self.MIN_PARALLEL_SCAN_DIRS:
+            with ThreadPoolExecutor(max_workers=self.SCAN_THREADS) as executor:
+                for paths in executor.map(self.list_directory, artist_paths):
+                    self._existing.update(paths)
+        else:
+            for artist_path in artist_paths:
+                self._existing.update(self.list_directory(artist_path))
+    
+    @staticmethod
+    def list_directory(path: str) -> List[str]:
+        """Return the paths of all entries in a directory, or none if it is unreadable."""
+        try:
+            with os.scandir(path) as entries:
+                return [entry.path for entry in entries]
+        except OSError:
+            # Only the rows under an unreadable directory are affected, as
+            # with a per-row existence check
+            return []
+    
+    def load_url_cache(self) -> Dict[str, Dict[str, str]]:
+        """Load the search and download results recorded by earlier runs."""
+        try:
+            with open(self.url_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"{Colors.WARNING}Warning: Ignoring unreadable cache {self.url_cache_path}: {e}{Colors.ENDC}")
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    def save_url_cache(self) -> None:
+        """Write the result cache for this output directory if it changed."""
+        with self._url_cache_lock:
+            if not self._url_cache_dirty:
+                return
+            data = json.dumps(self._url_cache, indent=1, sort_keys=True)
+            self._url_cache_dirty = False
+        
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self.url_cache_path.write_text(data, encoding='utf-8')
+        except OSError as e:
+            print(f"{Colors.WARNING}Warning: Could not save cache {self.url_cache_path}: {e}{Colors.ENDC}")
+    
+    def get_cached_result(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        Look up an earlier result for a URL or search.
+        
+        Failures are ignored when retrying is requested, or once they are
+        older than the failure TTL, so they run again.
+        
+        Args:
+            key: Video URL, or ytsearch1: query
+            
+        Returns:
+            Cached entry with 'status' of 'ok' or 'failed', or None
+        """
+        with self._url_cache_lock:
+            entry = self._url_cache.get(key)
+        if not isinstance(entry, dict):
+            return None
+        if entry.get('status') == 'failed':
+            if self.retry_failed:
+                return None
+            try:
+                age = (datetime.now() - datetime.fromisoformat(entry['ts'])).total_seconds()
+            except (KeyError, TypeError, ValueError):
+                return None
+            if age >= self.failed_ttl:
+                return None
+        return entry
+    
+    def record_result(self, key: str, ok: bool, **fields: str) -> None:
+        """Record the outcome of a search or download in the result cache."""
+        entry = {'status': 'ok' if ok else 'failed', 'ts': datetime.now().isoformat()}
+        entry.update(fields)
+        with self._url_cache_lock:
+            self._url_cache[key] = entry
+            self._url_cache_dirty = True
+    
+    def path_exists(self, path: str) -> bool:
+        """Check whether a file exists using the preloaded set."""
+        return path in self._existing
+    
+    def mark_existing(self, path: str) -> None:
+        """Record a file created during this run."""
+        self._existing.add(path)
+        
     def check_dependencies(self) -> bool:
         """Check if required dependencies are installed."""
         dependencies = ['yt-dlp', 'ffmpeg']
@@ -79,25 +322,7 @@ class MusicVideoOrganizer:
         Returns:
             Normalized filename safe for filesystem (lowercase, no special chars)
         """
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Normalize unicode characters (e.g., ä -> a)
-        import unicodedata
-        text = unicodedata.normalize('NFKD', text)
-        text = ''.join([c for c in text if not unicodedata.combining(c)])
-        
-        # Remove special characters except alphanumeric, spaces, and underscores
-        # Note: hyphens are now removed as well
-        text = re.sub(r'[^\w\s]', '', text)
-        
-        # Replace spaces with underscores
-        text = text.replace(' ', '_')
-        
-        # Remove multiple underscores
-        text = re.sub(r'_+', '_', text)
-        
-        return text.strip('_')
+        return normalize_filename(text)
     
     def validate_year(self, year_str: str) -> Optional[str]:
         """
@@ -113,9 +338,9 @@ class MusicVideoOrganizer:
             return None
             
         year_str = year_str.strip()
-        if re.match(r'^\d{4}$', year_str):
+        if YEAR_RE.match(year_str):
             year = int(year_str)
-            if 1900 <= year <= datetime.now().year + 1:
+            if 1900 <= year <= self.max_year:
                 return year_str
                 
         return None
@@ -124,9 +349,13 @@ class MusicVideoOrganizer:
         """Check if URL is a valid YouTube URL."""
         if not url:
             return False
+        
+        # Common spellings are settled by prefix alone; anything else is parsed
+        if url.startswith(YOUTUBE_URL_PREFIXES):
+            return True
             
         parsed = urlparse(url)
-        return parsed.netloc in ['www.youtube.com', 'youtube.com', 'youtu.be', 'm.youtube.com']
+        return parsed.netloc in YOUTUBE_HOSTS
     
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
@@ -134,7 +363,7 @@ class MusicVideoOrganizer:
         
         if parsed.netloc == 'youtu.be':
             return parsed.path[1:]
-        elif parsed.netloc in ['www.youtube.com', 'youtube.com', 'm.youtube.com']:
+        elif parsed.netloc in YOUTUBE_WATCH_HOSTS:
             if parsed.path == '/watch':
                 params = parse_qs(parsed.query)
                 return params.get('v', [None])[0]
@@ -153,20 +382,53 @@ class MusicVideoOrganizer:
             YouTube URL if found, None otherwise
         """
         query = f"{artist} {title} official music video"
-        print(f"  {Colors.CYAN}Searching YouTube: {query}{Colors.ENDC}")
+        search_key = f'ytsearch1:{query}'
         
-        cmd = [
-            'yt-dlp',
-            f'ytsearch1:{query}',
-            '--get-id',
-            '--no-warnings',
-            '--quiet'
-        ]
+        cached = self.get_cached_result(search_key)
+        if cached is not None:
+            if cached.get('status') == 'ok' and cached.get('id'):
+                url = f"https://www.youtube.com/watch?v={cached['id']}"
+                print(f"  {Colors.GREEN}Found video (cached search): {url}{Colors.ENDC}")
+                return url
+            print(f"  {Colors.WARNING}Skipping search: no result in a previous run{Colors.ENDC}")
+            return None
+        
+        print(f"  {Colors.CYAN}Searching YouTube: {query}{Colors.ENDC}")
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0 and result.stdout.strip():
-                video_id = result.stdout.strip()
+            if yt_dlp is not None:
+                video_id = self.search_video_id(query)
+            else:
+                # --flat-playlist reads the ID from the search results page
+                # instead of extracting the video page as well
+                cmd = [
+                    'yt-dlp',
+                    search_key,
+                    '--get-id',
+                    '--flat-playlist',
+                    '--socket-timeout', '10',
+                    '--no-warnings',
+                    '--quiet'
+                ]
+                
+                result = subprocess.run(cmd, capture_output=True, timeout=30)
+                if result.returncode != 0:
+                    # Network errors and rate limiting are not cached, so the
+                    # search runs again next time
+                    print(f"  {Colors.WARNING}Search failed: yt-dlp exited with status {result.returncode}{Colors.ENDC}")
+                    return None
+                
+                # The output is a bare ASCII video ID, so it is decoded
+                # directly rather than through a text-mode pipe
+                video_id = result.stdout.strip().decode('ascii', 'ignore')
+            
+            # Only a completed search that found nothing is cached as a failure
+            if video_id:
+                self.record_result(search_key, True, id=video_id)
+            else:
+                self.record_result(search_key, False)
+            
+            if video_id:
                 url = f"https://www.youtube.com/watch?v={video_id}"
                 print(f"  {Colors.GREEN}Found video: {url}{Colors.ENDC}")
                 return url
@@ -175,7 +437,35 @@ class MusicVideoOrganizer:
             
         return None
     
-    def download_video(self, url: str, output_path: Path, force_overwrite: bool = False) -> bool:
+    def search_video_id(self, query: str) -> Optional[str]:
+        """
+        Search YouTube with the in-process yt-dlp API.
+        
+        The YoutubeDL instance is reused across rows so its HTTP connections
+        and extractor state persist. Each thread gets its own instance, since
+        one instance is not safe to share between --jobs workers.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Video ID of the first result, or None if nothing was found
+        """
+        ydl = getattr(self._search_clients, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL({
+                'quiet': True,
+                'no_warnings': True,
+                'extract_flat': 'in_playlist',
+                'socket_timeout': 30
+            })
+            self._search_clients.ydl = ydl
+        
+        info = ydl.extract_info(f'ytsearch1:{query}', download=False)
+        entries = (info or {}).get('entries') or []
+        return entries[0].get('id') if entries else None
+    
+    def download_video(self, url: str, output_path: str, force_overwrite: bool = False) -> Optional[bool]:
         """
         Download video from YouTube URL.
         
@@ -185,14 +475,20 @@ class MusicVideoOrganizer:
             force_overwrite: Whether to force overwrite existing files
             
         Returns:
-            True if successful, False otherwise
+            True if successful, False if the download failed, or None if it
+            was skipped because the URL failed recently
         """
+        cached = self.get_cached_result(url)
+        if cached is not None and cached.get('status') == 'failed':
+            print(f"  {Colors.WARNING}Skipping download: URL failed in a previous run{Colors.ENDC}")
+            return None
+        
         print(f"  {Colors.BLUE}Downloading from: {url}{Colors.ENDC}")
         
         cmd = [
             'yt-dlp',
             url,
-            '-o', str(output_path),
+            '-o', output_path,
             '--format', 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
             '--merge-output-format', 'mp4',
             '--remux-video', 'mp4',
@@ -216,10 +512,18 @@ class MusicVideoOrganizer:
         
         try:
             result = subprocess.run(cmd, timeout=600)
-            if result.returncode == 0 and output_path.exists():
+            
+            # yt-dlp may leave a file behind even when it reports failure
+            file_exists = os.path.exists(output_path)
+            if file_exists:
+                self.mark_existing(output_path)
+            
+            if result.returncode == 0 and file_exists:
+                self.record_result(url, True)
                 print(f"  {Colors.GREEN}✓ Download successful{Colors.ENDC}")
                 return True
             else:
+                self.record_result(url, False)
                 print(f"  {Colors.FAIL}✗ Download failed{Colors.ENDC}")
                 return False
         except subprocess.TimeoutExpired:
@@ -237,12 +541,14 @@ class MusicVideoOrganizer:
             return elem
         return None
     
-    def read_existing_nfo(self, nfo_path: Path) -> Optional[ET.Element]:
+    def read_existing_nfo(self, nfo_path: str) -> Optional[ET.Element]:
         """Read existing NFO file and return root element."""
-        if nfo_path.exists():
+        if self.path_exists(nfo_path):
             try:
-                tree = ET.parse(nfo_path)
-                return tree.getroot()
+                # Feed raw bytes to the parser; an XMLParser cannot be reused
+                # once closed, so each read still builds its own
+                with open(nfo_path, 'rb') as f:
+                    return ET.parse(f).getroot()
             except ET.ParseError:
                 print(f"  {Colors.WARNING}Warning: Could not parse existing NFO{Colors.ENDC}")
         return None
@@ -284,24 +590,17 @@ class MusicVideoOrganizer:
             # Append the old sources section
             new_root.append(sources_elem)
     
-    def write_nfo(self, nfo_path: Path, root: ET.Element) -> None:
+    def write_nfo(self, nfo_path: str, root: ET.Element) -> None:
         """Write NFO file with pretty printing."""
-        # Convert to string with pretty printing
-        rough_string = ET.tostring(root, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        
-        # Add XML declaration
-        xml_str = reparsed.toprettyxml(indent="    ", encoding=None)
-        
-        # Fix the declaration
-        lines = xml_str.split('\n')
-        lines[0] = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        
-        # Remove empty lines
-        lines = [line for line in lines if line.strip()]
+        # Indent the tree in place instead of reparsing it with minidom
+        ET.indent(root, space="    ")
         
-        with open(nfo_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        # Serialize to UTF-8 bytes behind the fixed declaration and write the
+        # whole document in one call
+        data = self.XML_DECLARATION + ET.tostring(root, encoding='utf-8')
+        with open(nfo_path, 'wb') as f:
+            f.write(data)
+        self.mark_existing(nfo_path)
     
     def create_nfo_from_csv(self, row: Dict[str, str]) -> ET.Element:
         """Create NFO root element from CSV row."""
@@ -339,20 +638,21 @@ class MusicVideoOrganizer:
         
         return root
     
-    def create_artist_nfo(self, artist_name: str, artist_nfo_path: Path) -> None:
+    def create_artist_nfo(self, artist_name: str, artist_nfo_path: str) -> None:
         """Create artist.nfo file if it doesn't exist."""
-        if artist_nfo_path.exists():
-            print(f"  {Colors.CYAN}artist.nfo exists{Colors.ENDC}")
-            return
-        
-        # Create artist NFO
-        root = ET.Element('artist')
-        name_elem = ET.SubElement(root, 'name')
-        name_elem.text = artist_name
-        
-        # Write with pretty printing
-        self.write_nfo(artist_nfo_path, root)
-        print(f"  {Colors.GREEN}✓ Created artist.nfo{Colors.ENDC}")
+        with self.path_lock(artist_nfo_path):
+            if self.path_exists(artist_nfo_path):
+                print(f"  {Colors.CYAN}artist.nfo exists{Colors.ENDC}")
+                return
+            
+            # Create artist NFO
+            root = ET.Element('artist')
+            name_elem = ET.SubElement(root, 'name')
+            name_elem.text = artist_name
+            
+            # Write with pretty printing
+            self.write_nfo(artist_nfo_path, root)
+            print(f"  {Colors.GREEN}✓ Created artist.nfo{Colors.ENDC}")
     
     def process_video(self, row: Dict[str, str], row_num: int) -> None:
         """
@@ -368,7 +668,7 @@ class MusicVideoOrganizer:
         
         if not artist or not title:
             print(f"{Colors.FAIL}Row {row_num}: Missing required fields (artist/title){Colors.ENDC}")
-            self.stats['failed'] += 1
+            self.increment_stat('failed')
             return
         
         print(f"\n{Colors.HEADER}[Row {row_num}] {artist} - {title}{Colors.ENDC}")
@@ -377,170 +677,211 @@ class MusicVideoOrganizer:
         artist_dir = self.normalize_filename(artist)
         title_file = self.normalize_filename(title)
         
-        artist_dir_path = self.output_dir / artist_dir
-        artist_dir_path.mkdir(parents=True, exist_ok=True)
-        
-        video_path = artist_dir_path / f"{title_file}.mp4"
-        nfo_path = artist_dir_path / f"{title_file}.nfo"
-        artist_nfo_path = artist_dir_path / "artist.nfo"
-        
-        # Check if video exists
-        video_exists = video_path.exists()
+        artist_dir_path = os.path.join(self.output_dir_str, artist_dir)
+        if artist_dir_path not in self._artist_dirs:
+            os.makedirs(artist_dir_path, exist_ok=True)
+            self._artist_dirs.add(artist_dir_path)
         
-        # Handle existing NFO
-        existing_root = self.read_existing_nfo(nfo_path)
+        video_path = os.path.join(artist_dir_path, f"{title_file}.mp4")
+        nfo_path = os.path.join(artist_dir_path, f"{title_file}.nfo")
+        artist_nfo_path = os.path.join(artist_dir_path, "artist.nfo")
         
-        # Check if force download is enabled
-        if self.force_download:
-            print(f"  {Colors.WARNING}Force download enabled - ignoring existing sources{Colors.ENDC}")
+        # Rows for the same video must not overlap when running with --jobs
+        with self.path_lock(video_path):
+            # Check if video exists
+            video_exists = self.path_exists(video_path)
             
-            # Get URL from CSV
-            youtube_url = row.get('youtube_url', '').strip()
-            download_success = False
+            # Handle existing NFO
+            existing_root = self.read_existing_nfo(nfo_path)
             
-            # Use existing NFO or create new one
-            if existing_root is not None:
-                root = existing_root
-                existing_sources = self.get_existing_sources(root)
-            else:
-                root = self.create_nfo_from_csv(row)
-                existing_sources = []
-            
-            # Try provided URL first
-            if youtube_url and self.is_valid_youtube_url(youtube_url):
-                print(f"  {Colors.BLUE}Force downloading from provided URL{Colors.ENDC}")
-                download_success = self.download_video(youtube_url, video_path, force_overwrite=True)
+            # Check if force download is enabled
+            if self.force_download:
+                print(f"  {Colors.WARNING}Force download enabled - ignoring existing sources{Colors.ENDC}")
                 
-                # Only add source if not already in NFO (avoid duplicates)
-                if youtube_url not in existing_sources:
-                    self.add_source_to_nfo(root, youtube_url, failed=not download_success, search=False)
-            
-            # Try search if needed and no URL provided
-            if not download_success and not youtube_url and not self.no_search:
-                search_url = self.search_youtube(artist, title)
-                if search_url:
-                    print(f"  {Colors.BLUE}Force downloading from search result{Colors.ENDC}")
-                    download_success = self.download_video(search_url, video_path, force_overwrite=True)
-                    
-                    # Only add source if not already in NFO
-                    if search_url not in existing_sources:
-                        self.add_source_to_nfo(root, search_url,
-                                             failed=not download_success, search=True)
-            
-            # Write NFO
-            self.write_nfo(nfo_path, root)
-            if existing_root is None:
-                self.stats['nfo_created'] += 1
-            
-            # Create artist.nfo
-            self.create_artist_nfo(artist, artist_nfo_path)
-            
-            if download_success:
-                self.stats['downloaded'] += 1
-                print(f"  {Colors.GREEN}✓ Video downloaded successfully (force){Colors.ENDC}")
-            else:
-                self.stats['failed'] += 1
-                print(f"  {Colors.FAIL}✗ Failed to download video (force){Colors.ENDC}")
+                # Get URL from CSV
+                youtube_url = row.get('youtube_url', '').strip()
+                download_success = False
                 
-        elif video_exists:
-            print(f"  {Colors.CYAN}Video already exists{Colors.ENDC}")
-
-            # Check and create artist.nfo if missing
-            self.create_artist_nfo(artist, artist_nfo_path)
-
-            # Create NFO if missing
-            if existing_root is None:
-                print(f"  {Colors.WARNING}Creating missing NFO file{Colors.ENDC}")
-                root = self.create_nfo_from_csv(row)
+                # Use existing NFO or create new one
+                if existing_root is not None:
+                    root = existing_root
+                    existing_sources = self.get_existing_sources(root)
+                else:
+                    root = self.create_nfo_from_csv(row)
+                    existing_sources = []
                 
-                # Add source if provided
-                youtube_url = row.get('youtube_url', '').strip()
+                # Try provided URL first
                 if youtube_url and self.is_valid_youtube_url(youtube_url):
-                    self.add_source_to_nfo(root, youtube_url, failed=False, search=False)
+                    print(f"  {Colors.BLUE}Force downloading from provided URL{Colors.ENDC}")
+                    download_success = self.download_video(youtube_url, video_path, force_overwrite=True)
+                    
+                    # Only add source if not already in NFO (avoid duplicates),
+                    # and not for a download skipped because of an earlier failure
+                    if download_success is not None and youtube_url not in existing_sources:
+                        self.add_source_to_nfo(root, youtube_url, failed=not download_success, search=False)
+                
+                # Try search if needed and no URL provided
+                if not download_success and not youtube_url and not self.no_search:
+                    search_url = self.search_youtube(artist, title)
+                    if search_url:
+                        print(f"  {Colors.BLUE}Force downloading from search result{Colors.ENDC}")
+                        download_success = self.download_video(search_url, video_path, force_overwrite=True)
+                        
+                        # Only add source if not already in NFO
+                        if download_success is not None and search_url not in existing_sources:
+                            self.add_source_to_nfo(root, search_url,
+                                                 failed=not download_success, search=True)
                 
+                # Write NFO
                 self.write_nfo(nfo_path, root)
-                self.stats['nfo_created'] += 1
+                if existing_root is None:
+                    self.increment_stat('nfo_created')
                 
-            else:
-                # NFO exists - check if we should update it
-                if self.overwrite:
-                    # Overwrite mode: CSV is authoritative, recreate NFO from CSV
-                    print(f"  {Colors.WARNING}Overwrite mode: Updating NFO from CSV data{Colors.ENDC}")
+                # Create artist.nfo
+                self.create_artist_nfo(artist, artist_nfo_path)
+                
+                if download_success:
+                    self.increment_stat('downloaded')
+                    print(f"  {Colors.GREEN}✓ Video downloaded successfully (force){Colors.ENDC}")
+                else:
+                    self.increment_stat('failed')
+                    print(f"  {Colors.FAIL}✗ Failed to download video (force){Colors.ENDC}")
                     
-                    # Create new NFO from CSV
+            elif video_exists:
+                print(f"  {Colors.CYAN}Video already exists{Colors.ENDC}")
+
+                # Check and create artist.nfo if missing
+                self.create_artist_nfo(artist, artist_nfo_path)
+
+                # Create NFO if missing
+                if existing_root is None:
+                    print(f"  {Colors.WARNING}Creating missing NFO file{Colors.ENDC}")
                     root = self.create_nfo_from_csv(row)
                     
-                    # Preserve existing sources section
-                    self.preserve_sources_section(existing_root, root)
-                    
-                    # Check if there's a new URL to add
+                    # Add source if provided
                     youtube_url = row.get('youtube_url', '').strip()
                     if youtube_url and self.is_valid_youtube_url(youtube_url):
-                        existing_sources = self.get_existing_sources(root)
+                        self.add_source_to_nfo(root, youtube_url, failed=False, search=False)
+                    
+                    self.write_nfo(nfo_path, root)
+                    self.increment_stat('nfo_created')
+                    
+                else:
+                    # NFO exists - check if we should update it
+                    if self.overwrite:
+                        # Overwrite mode: CSV is authoritative, recreate NFO from CSV
+                        print(f"  {Colors.WARNING}Overwrite mode: Updating NFO from CSV data{Colors.ENDC}")
                         
-                        if youtube_url not in existing_sources:
-                            print(f"  {Colors.BLUE}New URL found - attempting redownload{Colors.ENDC}")
-                            
-                            # Try download with force overwrite since we're replacing existing video
-                            success = self.download_video(youtube_url, video_path, force_overwrite=True)
-                            self.add_source_to_nfo(root, youtube_url,
-                                                 failed=not success, search=False)
+                        # Create new NFO from CSV
+                        root = self.create_nfo_from_csv(row)
+                        
+                        # Preserve existing sources section
+                        self.preserve_sources_section(existing_root, root)
+                        
+                        # Check if there's a new URL to add
+                        youtube_url = row.get('youtube_url', '').strip()
+                        if youtube_url and self.is_valid_youtube_url(youtube_url):
+                            existing_sources = self.get_existing_sources(root)
                             
-                            if success:
-                                self.stats['downloaded'] += 1
+                            if youtube_url not in existing_sources:
+                                print(f"  {Colors.BLUE}New URL found - attempting redownload{Colors.ENDC}")
+                                
+                                # Try download with force overwrite since we're replacing existing video
+                                success = self.download_video(youtube_url, video_path, force_overwrite=True)
+                                if success is not None:
+                                    self.add_source_to_nfo(root, youtube_url,
+                                                         failed=not success, search=False)
+                                
+                                if success:
+                                    self.increment_stat('downloaded')
+                                else:
+                                    self.increment_stat('failed')
                             else:
-                                self.stats['failed'] += 1
+                                print(f"  {Colors.CYAN}URL already in sources{Colors.ENDC}")
+                                self.increment_stat('skipped')
                         else:
-                            print(f"  {Colors.CYAN}URL already in sources{Colors.ENDC}")
-                            self.stats['skipped'] += 1
+                            self.increment_stat('skipped')
+                        
+                        # Write updated NFO
+                        self.write_nfo(nfo_path, root)
+                        print(f"  {Colors.GREEN}✓ NFO updated from CSV{Colors.ENDC}")
                     else:
-                        self.stats['skipped'] += 1
-                    
-                    # Write updated NFO
-                    self.write_nfo(nfo_path, root)
-                    print(f"  {Colors.GREEN}✓ NFO updated from CSV{Colors.ENDC}")
+                        # No overwrite: just skip
+                        print(f"  {Colors.CYAN}Skipping: Video and NFO exist, overwrite disabled{Colors.ENDC}")
+                        self.increment_stat('skipped')
+            else:
+                # Video doesn't exist - download it
+                print(f"  {Colors.BLUE}Downloading new video{Colors.ENDC}")
+                
+                # Create NFO, keeping sources recorded by earlier attempts
+                root = self.create_nfo_from_csv(row)
+                if existing_root is not None:
+                    self.preserve_sources_section(existing_root, root)
+                
+                # Try provided URL first
+                youtube_url = row.get('youtube_url', '').strip()
+                download_success = False
+                
+                if youtube_url and self.is_valid_youtube_url(youtube_url):
+                    download_success = self.download_video(youtube_url, video_path)
+                    # A download skipped because of an earlier failure was not
+                    # attempted, so it is not recorded as a new source
+                    if download_success is not None:
+                        self.add_source_to_nfo(root, youtube_url, failed=not download_success, search=False)
+                
+                # Try search if needed
+                if not download_success and not self.no_search:
+                    search_url = self.search_youtube(artist, title)
+                    if search_url:
+                        download_success = self.download_video(search_url, video_path)
+                        if download_success is not None:
+                            self.add_source_to_nfo(root, search_url, 
+                                                 failed=not download_success, search=True)
+                
+                # Write NFO
+                self.write_nfo(nfo_path, root)
+                self.increment_stat('nfo_created')
+                
+                # Create artist.nfo
+                self.create_artist_nfo(artist, artist_nfo_path)
+                
+                if download_success:
+                    self.increment_stat('downloaded')
+                    print(f"  {Colors.GREEN}✓ Video downloaded successfully{Colors.ENDC}")
                 else:
-                    # No overwrite: just skip
-                    print(f"  {Colors.CYAN}Skipping: Video and NFO exist, overwrite disabled{Colors.ENDC}")
-                    self.stats['skipped'] += 1
-        else:
-            # Video doesn't exist - download it
-            print(f"  {Colors.BLUE}Downloading new video{Colors.ENDC}")
-            
-            # Create NFO
-            root = self.create_nfo_from_csv(row)
+                    self.increment_stat('failed')
+                    print(f"  {Colors.FAIL}✗ Failed to download video{Colors.ENDC}")
             
-            # Try provided URL first
-            youtube_url = row.get('youtube_url', '').strip()
-            download_success = False
-            
-            if youtube_url and self.is_valid_youtube_url(youtube_url):
-                download_success = self.download_video(youtube_url, video_path)
-                self.add_source_to_nfo(root, youtube_url, failed=not download_success, search=False)
-            
-            # Try search if needed
-            if not download_success and not self.no_search:
-                search_url = self.search_youtube(artist, title)
-                if search_url:
-                    download_success = self.download_video(search_url, video_path)
-                    self.add_source_to_nfo(root, search_url, 
-                                         failed=not download_success, search=True)
-            
-            # Write NFO
-            self.write_nfo(nfo_path, root)
-            self.stats['nfo_created'] += 1
-            
-            # Create artist.nfo
-            self.create_artist_nfo(artist, artist_nfo_path)
+        self.increment_stat('processed')
+    
+    def is_duplicate_row(self, row: Dict[str, str], row_num: int, seen: set) -> bool:
+        """
+        Check whether a row targets the same output file as an earlier row.
+        
+        Args:
+            row: Normalized CSV row data
+            row_num: Row number for logging
+            seen: (artist_dir, title_file) keys of rows already queued; updated in place
             
-            if download_success:
-                self.stats['downloaded'] += 1
-                print(f"  {Colors.GREEN}✓ Video downloaded successfully{Colors.ENDC}")
-            else:
-                self.stats['failed'] += 1
-                print(f"  {Colors.FAIL}✗ Failed to download video{Colors.ENDC}")
+        Returns:
+            True if the row duplicates an earlier one and was counted as skipped
+        """
+        artist = row.get('artist', '').strip()
+        title = row.get('title', '').strip()
+        
+        # Incomplete rows are left to process_video to report
+        if not artist or not title:
+            return False
+        
+        key = (self.normalize_filename(artist), self.normalize_filename(title))
+        if key not in seen:
+            seen.add(key)
+            return False
         
-        self.stats['processed'] += 1
+        print(f"\n{Colors.CYAN}[Row {row_num}] {artist} - {title}: skipped, duplicate row{Colors.ENDC}")
+        self.increment_stat('skipped')
+        self.increment_stat('processed')
+        return True
     
     def process_csv(self, csv_path: str) -> None:
         """
@@ -554,17 +895,21 @@ class MusicVideoOrganizer:
         print(f"{Colors.CYAN}Output directory: {self.output_dir}{Colors.ENDC}")
         print("-" * 60)
         
+        # Answer per-row existence checks from a single directory scan
+        self.preload_existing()
+        
         try:
             with open(csv_path, 'r', encoding='utf-8') as f:
-                # Detect delimiter
-                sample = f.readline()
-                sniffer = csv.Sniffer()
-                delimiter = sniffer.sniff(sample).delimiter
+                # Detect delimiter: the candidate appearing most often in the
+                # header line, with comma winning ties
+                header_line = f.readline()
+                delimiter = max(self.DELIMITERS, key=header_line.count)
                 
                 # Be kind, rewind
                 f.seek(0)
                 
-                reader = csv.DictReader(f, delimiter=delimiter)
+                reader = csv.reader(f, delimiter=delimiter)
+                header = next(reader, [])
                 
                 # Normalize field names (handle variations)
                 field_mappings = {
@@ -577,16 +922,43 @@ class MusicVideoOrganizer:
                     'tags': 'tag'
                 }
                 
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is 1)
-                    # Normalize field names
-                    normalized_row = {}
-                    for key, value in row.items():
-                        if key:
-                            key_lower = key.lower().strip()
-                            mapped_key = field_mappings.get(key_lower, key_lower)
-                            normalized_row[mapped_key] = value
+                # Map each normalized field name to its column once, so rows
+                # are read by index instead of through a per-row header dict.
+                # Later duplicate columns win, as they did with DictReader
+                columns = {}
+                for i, key in enumerate(header):
+                    if key:
+                        key_lower = key.lower().strip()
+                        columns[field_mappings.get(key_lower, key_lower)] = i
+                
+                rows = []
+                seen = set()
+                row_num = 1  # Header is row 1
+                for row in reader:
+                    # Skip blank lines without counting them
+                    if not row:
+                        continue
+                    row_num += 1
                     
-                    self.process_video(normalized_row, row_num)
+                    # Short rows leave the missing fields empty
+                    row_len = len(row)
+                    normalized_row = {
+                        key: row[i] if i < row_len else ''
+                        for key, i in columns.items()
+                    }
+                    
+                    # Rows that resolve to an output file already handled in
+                    # this run are skipped before any download is attempted
+                    if self.is_duplicate_row(normalized_row, row_num, seen):
+                        continue
+                    
+                    if self.jobs > 1:
+                        rows.append((row_num, normalized_row))
+                    else:
+                        self.process_video(normalized_row, row_num)
+                
+                if rows:
+                    self.process_rows_parallel(rows)
                     
         except FileNotFoundError:
             print(f"{Colors.FAIL}Error: CSV file not found: {csv_path}{Colors.ENDC}")
@@ -596,10 +968,32 @@ class MusicVideoOrganizer:
             sys.exit(1)
         except KeyboardInterrupt:
             print(f"\n{Colors.WARNING}Process interrupted by user{Colors.ENDC}")
+        finally:
+            # Keep results from completed rows even after errors or interrupts
+            self.save_url_cache()
         
         # Print summary
         self.print_summary()
     
+    def process_rows_parallel(self, rows: Iterable[Tuple[int, Dict[str, str]]]) -> None:
+        """
+        Process CSV rows concurrently on a thread pool.
+        
+        Each row is dominated by yt-dlp and ffmpeg subprocesses, so threads
+        overlap downloads across rows. Output from concurrent rows interleaves.
+        
+        Args:
+            rows: (row_num, normalized_row) pairs
+        """
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        try:
+            futures = [executor.submit(self.process_video, row, row_num) for row_num, row in rows]
+            for future in as_completed(futures):
+                future.result()
+        finally:
+            # On interrupt, drop rows that have not started yet
+            executor.shutdown(wait=True, cancel_futures=True)
+    
     def print_summary(self) -> None:
         """Print processing summary."""
         print("\n" + "=" * 60)
@@ -623,6 +1017,8 @@ Examples:
   %(prog)s videos.csv -o /media/MusicVideos
   %(prog)s videos.csv -o ./output --overwrite
   %(prog)s videos.csv -o ./output --no-search --cookies cookies.txt
+  %(prog)s videos.csv -o ./output --jobs 4
+  %(prog)s videos.csv -o ./output --retry-failed
         """
     )
     
@@ -660,6 +1056,26 @@ Examples:
         help='Cookie file for YouTube authentication'
     )
     
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Number of CSV rows to process concurrently (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--retry-failed',
+        action='store_true',
+        help='Retry URLs and searches that failed in previous runs instead of skipping them'
+    )
+    
+    parser.add_argument(
+        '--failed-ttl-days',
+        type=float,
+        default=7,
+        help='Days a cached failure is skipped before it is retried (default: 7)'
+    )
+    
     args = parser.parse_args()
     
     # Initialize organizer
@@ -668,7 +1084,10 @@ Examples:
         overwrite=args.overwrite,
         no_search=args.no_search,
         cookies=args.cookies,
-        force_download=args.force_download
+        force_download=args.force_download,
+        jobs=args.jobs,
+        retry_failed=args.retry_failed,
+        failed_ttl_days=args.failed_ttl_days
     )
     
     # Check dependencies
@@ -11,15 +11,27 @@ import argparse
 import os
 import re
 import shutil
+import sqlite3
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
 from urllib.parse import urlparse
 
+# Searching in-process avoids starting a yt-dlp interpreter per NFO; the
+# yt-dlp executable is used when the package is not importable
+try:
+    import yt_dlp
+except ImportError:
+    yt_dlp = None
+
 # ANSI color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -33,12 +45,42 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Hosts accepted as YouTube URLs
+YOUTUBE_HOSTS = frozenset({'www.youtube.com', 'youtube.com', 'youtu.be', 'm.youtube.com'})
+
+# URL prefixes that always have one of YOUTUBE_HOSTS as their host
+YOUTUBE_URL_PREFIXES = tuple(
+    f'{scheme}://{host}/' for scheme in ('https', 'http') for host in sorted(YOUTUBE_HOSTS)
+)
+
+
 class MusicVideoReplacer:
     """Main class for replacing music videos from existing NFO files."""
     
-    def __init__(self, cookies: Optional[str] = None, dry_run: bool = False):
+    # ElementTree cannot emit standalone="yes", so the declaration is fixed
+    XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    
+    # Search results persist across runs in the user's cache directory
+    SEARCH_CACHE_PATH = (Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+                         / 'mvreplacer' / 'search.sqlite')
+    
+    # Seconds a single download may run before it is abandoned
+    DOWNLOAD_TIMEOUT = 600
+    
+    def __init__(self, cookies: Optional[str] = None, dry_run: bool = False,
+                 jobs: int = 1, in_process: bool = False, use_cache: bool = True,
+                 cache_ttl_days: float = 30, missing_only: bool = False):
         self.cookies = cookies
         self.dry_run = dry_run
+        self.missing_only = missing_only
+        self.jobs = max(1, jobs)
+        self.cache_ttl = cache_ttl_days * 86400
+        
+        # Downloads run the yt-dlp executable, which can be killed when it
+        # hangs. In-process downloads are opt-in, and only used when the
+        # yt-dlp package is importable and new enough to expose parse_options
+        self.use_api = (in_process and yt_dlp is not None
+                        and hasattr(yt_dlp, 'parse_options'))
         self.stats = {
             'processed': 0,
             'replaced': 0,
@@ -46,6 +88,73 @@ class MusicVideoReplacer:
             'failed': 0
         }
         
+        # NFOs may run on worker threads (--jobs), so shared state is locked
+        self._stats_lock = threading.Lock()
+        self._path_locks = defaultdict(threading.Lock)
+        self._path_locks_lock = threading.Lock()
+        
+        # One in-process yt-dlp search client per thread
+        self._search_clients = threading.local()
+        
+        # Connection to the search cache, shared by worker threads under a lock
+        self._search_cache_lock = threading.Lock()
+        self._search_cache = self.open_search_cache() if use_cache else None
+    
+    def open_search_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the persistent search cache, creating it if needed."""
+        try:
+            self.SEARCH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.SEARCH_CACHE_PATH), check_same_thread=False)
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS search '
+                '(query TEXT PRIMARY KEY, url TEXT NOT NULL, ts INTEGER NOT NULL)'
+            )
+            conn.commit()
+            return conn
+        except (OSError, sqlite3.Error) as e:
+            print(f"{Colors.WARNING}Warning: Search cache disabled: {e}{Colors.ENDC}")
+            return None
+    
+    def get_cached_search(self, query: str) -> Optional[str]:
+        """Return the cached result URL for a query if it has not expired."""
+        if self._search_cache is None:
+            return None
+        with self._search_cache_lock:
+            row = self._search_cache.execute(
+                'SELECT url, ts FROM search WHERE query = ?', (query,)
+            ).fetchone()
+        if row and time.time() - row[1] < self.cache_ttl:
+            return row[0]
+        return None
+    
+    def store_search(self, query: str, url: str) -> None:
+        """Record a successful search result in the cache."""
+        if self._search_cache is None:
+            return
+        try:
+            with self._search_cache_lock, self._search_cache:
+                self._search_cache.execute(
+                    'INSERT OR REPLACE INTO search (query, url, ts) VALUES (?, ?, ?)',
+                    (query, url, int(time.time()))
+                )
+        except sqlite3.Error as e:
+            print(f"  {Colors.WARNING}Warning: Could not cache search result: {e}{Colors.ENDC}")
+    
+    def increment_stat(self, key: str) -> None:
+        """Increment a summary counter; safe to call from worker threads."""
+        with self._stats_lock:
+            self.stats[key] += 1
+    
+    def path_lock(self, path: Path) -> threading.Lock:
+        """
+        Get the lock guarding work on a single NFO.
+        
+        The same NFO given twice on the command line must not be searched,
+        downloaded and rewritten by two threads at once.
+        """
+        with self._path_locks_lock:
+            return self._path_locks[path.resolve()]
+        
     def check_dependencies(self) -> bool:
         """Check if required dependencies are installed."""
         dependencies = ['yt-dlp', 'ffmpeg']
@@ -66,9 +175,13 @@ class MusicVideoReplacer:
         """Check if URL is a valid YouTube URL."""
         if not url:
             return False
+        
+        # Common spellings are settled by prefix alone; anything else is parsed
+        if url.startswith(YOUTUBE_URL_PREFIXES):
+            return True
             
         parsed = urlparse(url)
-        return parsed.netloc in ['www.youtube.com', 'youtube.com', 'youtu.be', 'm.youtube.com']
+        return parsed.netloc in YOUTUBE_HOSTS
     
     def extract_video_info_from_nfo(self, root: ET.Element) -> Tuple[Optional[str], Optional[str]]:
         """Extract artist and title from NFO."""
@@ -102,28 +215,66 @@ class MusicVideoReplacer:
             YouTube URL if found, None otherwise
         """
         query = f"{artist} {title} official music video"
-        print(f"  {Colors.CYAN}Searching YouTube: {query}{Colors.ENDC}")
         
-        cmd = [
-            'yt-dlp',
-            f'ytsearch1:{query}',
-            '--get-id',
-            '--no-warnings',
-            '--quiet'
-        ]
+        cached_url = self.get_cached_search(query)
+        if cached_url:
+            print(f"  {Colors.GREEN}Found video (cached search): {cached_url}{Colors.ENDC}")
+            return cached_url
+        
+        print(f"  {Colors.CYAN}Searching YouTube: {query}{Colors.ENDC}")
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0 and result.stdout.strip():
-                video_id = result.stdout.strip()
+            if yt_dlp is not None:
+                video_id = self.search_video_id(query)
+            else:
+                cmd = [
+                    'yt-dlp',
+                    f'ytsearch1:{query}',
+                    '--get-id',
+                    '--no-warnings',
+                    '--quiet'
+                ]
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                video_id = result.stdout.strip() if result.returncode == 0 else None
+            
+            if video_id:
                 url = f"https://www.youtube.com/watch?v={video_id}"
                 print(f"  {Colors.GREEN}Found video: {url}{Colors.ENDC}")
+                self.store_search(query, url)
                 return url
         except (subprocess.TimeoutExpired, Exception) as e:
             print(f"  {Colors.WARNING}Search failed: {str(e)}{Colors.ENDC}")
             
         return None
     
+    def search_video_id(self, query: str) -> Optional[str]:
+        """
+        Search YouTube with the in-process yt-dlp API.
+        
+        The YoutubeDL instance is reused across NFOs so its HTTP connections
+        and extractor state persist. Each thread gets its own instance, since
+        one instance is not safe to share between --jobs workers.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Video ID of the first result, or None if nothing was found
+        """
+        ydl = getattr(self._search_clients, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL({
+                'quiet': True,
+                'no_warnings': True,
+                'extract_flat': 'in_playlist',
+                'socket_timeout': 30
+            })
+            self._search_clients.ydl = ydl
+        
+        info = ydl.extract_info(f'ytsearch1:{query}', download=False)
+        entries = (info or {}).get('entries') or []
+        return entries[0].get('id') if entries else None
+    
     def download_video(self, url: str, output_path: Path) -> bool:
         """
         Download video from YouTube URL.
@@ -142,8 +293,7 @@ class MusicVideoReplacer:
             
         print(f"  {Colors.BLUE}Downloading from: {url}{Colors.ENDC}")
         
-        cmd = [
-            'yt-dlp',
+        args = [
             url,
             '-o', str(output_path),
             '--format', 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
@@ -161,11 +311,15 @@ class MusicVideoReplacer:
         ]
 
         if self.cookies:
-            cmd.extend(['--cookies', self.cookies])
+            args.extend(['--cookies', self.cookies])
         
         try:
-            result = subprocess.run(cmd, timeout=600)
-            if result.returncode == 0 and output_path.exists():
+            if self.use_api:
+                returncode = self.download_in_process(args)
+            else:
+                returncode = subprocess.run(['yt-dlp'] + args, timeout=self.DOWNLOAD_TIMEOUT).returncode
+            
+            if returncode == 0 and output_path.exists():
                 print(f"  {Colors.GREEN}✓ Download successful{Colors.ENDC}")
                 return True
             else:
@@ -178,6 +332,37 @@ class MusicVideoReplacer:
             print(f"  {Colors.FAIL}✗ Download error: {str(e)}{Colors.ENDC}")
             return False
     
+    def download_in_process(self, args: List[str]) -> int:
+        """
+        Run a download through the yt-dlp Python API.
+        
+        The command-line arguments are translated by yt-dlp's own option
+        parser, so format selection, sorting, remuxing and sleeps behave
+        exactly as with the executable. Each call gets its own YoutubeDL,
+        which keeps concurrent --jobs downloads independent.
+        
+        A thread cannot be killed like the executable, so the deadline is
+        checked whenever yt-dlp reports download or post-processing progress,
+        and a download still running past DOWNLOAD_TIMEOUT is aborted.
+        
+        Args:
+            args: yt-dlp command-line arguments, without the program name
+            
+        Returns:
+            yt-dlp exit code; 0 on success
+        """
+        deadline = time.monotonic() + self.DOWNLOAD_TIMEOUT
+        
+        def check_deadline(status: dict) -> None:
+            if time.monotonic() > deadline:
+                raise subprocess.TimeoutExpired('yt-dlp', self.DOWNLOAD_TIMEOUT)
+        
+        ydl_opts = yt_dlp.parse_options(args).ydl_opts
+        ydl_opts['progress_hooks'] = ydl_opts.get('progress_hooks', []) + [check_deadline]
+        ydl_opts['postprocessor_hooks'] = ydl_opts.get('postprocessor_hooks', []) + [check_deadline]
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            return ydl.download([args[0]])
+    
     def add_source_to_nfo(self, root: ET.Element, url: str, 
                          failed: bool = False, search: bool = True) -> None:
         """Add a source URL to NFO with metadata."""
@@ -200,24 +385,38 @@ class MusicVideoReplacer:
             print(f"  {Colors.CYAN}[DRY RUN] Would update NFO: {nfo_path}{Colors.ENDC}")
             return
             
-        # Convert to string with pretty printing
-        rough_string = ET.tostring(root, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
+        # Indent the tree in place instead of reparsing it with minidom
+        ET.indent(root, space="    ")
         
-        # Add XML declaration
-        xml_str = reparsed.toprettyxml(indent="    ", encoding=None)
+        # Serialize to UTF-8 bytes behind the fixed declaration and write the
+        # whole document in one call
+        data = self.XML_DECLARATION + ET.tostring(root, encoding='utf-8')
+        self.replace_file(nfo_path, data)
         
-        # Fix the declaration
-        lines = xml_str.split('\n')
-        lines[0] = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        print(f"  {Colors.GREEN}✓ NFO updated{Colors.ENDC}")
+    
+    def replace_file(self, nfo_path: Path, data: bytes) -> None:
+        """
+        Atomically replace a file's contents, keeping its permissions.
         
-        # Remove empty lines
-        lines = [line for line in lines if line.strip()]
+        The data goes to a temporary file in the same directory which is then
+        renamed over the NFO, so an interrupted write never leaves it truncated.
         
-        with open(nfo_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        Args:
+            nfo_path: Path to NFO file
+            data: New file contents
+        """
+        with tempfile.NamedTemporaryFile(dir=nfo_path.parent, prefix=f'.{nfo_path.name}.',
+                                         suffix='.tmp', delete=False) as f:
+            f.write(data)
         
-        print(f"  {Colors.GREEN}✓ NFO updated{Colors.ENDC}")
+        try:
+            # Keep the original file's permissions rather than the temp file's 0600
+            shutil.copymode(nfo_path, f.name)
+            os.replace(f.name, nfo_path)
+        except OSError:
+            os.unlink(f.name)
+            raise
     
     def process_nfo(self, nfo_path: Path) -> None:
         """
@@ -226,12 +425,17 @@ class MusicVideoReplacer:
         Args:
             nfo_path: Path to NFO file
         """
+        with self.path_lock(nfo_path):
+            self._process_nfo(nfo_path)
+    
+    def _process_nfo(self, nfo_path: Path) -> None:
+        """Process a single NFO file; callers hold its path lock."""
         print(f"\n{Colors.HEADER}{Colors.BOLD}Processing: {nfo_path}{Colors.ENDC}")
         
         # Check if NFO exists
         if not nfo_path.exists():
             print(f"{Colors.FAIL}Error: NFO file not found{Colors.ENDC}")
-            self.stats['failed'] += 1
+            self.increment_stat('failed')
             return
         
         # Parse NFO
@@ -240,7 +444,7 @@ class MusicVideoReplacer:
             root = tree.getroot()
         except ET.ParseError as e:
             print(f"{Colors.FAIL}Error parsing NFO: {e}{Colors.ENDC}")
-            self.stats['failed'] += 1
+            self.increment_stat('failed')
             return
         
         # Extract artist and title
@@ -248,7 +452,7 @@ class MusicVideoReplacer:
         
         if not artist or not title:
             print(f"{Colors.FAIL}Error: Missing artist or title in NFO{Colors.ENDC}")
-            self.stats['failed'] += 1
+            self.increment_stat('failed')
             return
         
         print(f"  Artist: {artist}")
@@ -256,6 +460,8 @@ class MusicVideoReplacer:
         
         # Get existing sources
         existing_sources = self.get_existing_sources(root)
+        # The list keeps numbered display order; membership checks use the set
+        existing_set = frozenset(existing_sources)
         
         if existing_sources:
             print(f"  {Colors.CYAN}Existing sources: {len(existing_sources)}{Colors.ENDC}")
@@ -274,18 +480,25 @@ class MusicVideoReplacer:
         else:
             print(f"  {Colors.WARNING}Video file missing: {video_path.name}{Colors.ENDC}")
         
+        # An NFO with a video and a recorded source needs nothing in
+        # missing-only mode, so skip the search and download entirely
+        if self.missing_only and video_exists and existing_sources:
+            print(f"  {Colors.WARNING}Video already present, skipping{Colors.ENDC}")
+            self.increment_stat('skipped')
+            return
+        
         # Search for new source
         search_url = self.search_youtube(artist, title)
         
         if not search_url:
             print(f"  {Colors.FAIL}No new source found{Colors.ENDC}")
-            self.stats['skipped'] += 1
+            self.increment_stat('skipped')
             return
         
         # Check if URL is already in sources
-        if search_url in existing_sources:
+        if search_url in existing_set:
             print(f"  {Colors.WARNING}Source already exists in NFO, skipping{Colors.ENDC}")
-            self.stats['skipped'] += 1
+            self.increment_stat('skipped')
             return
         
         # Download from new source
@@ -298,13 +511,13 @@ class MusicVideoReplacer:
         self.write_nfo(nfo_path, root)
         
         if download_success:
-            self.stats['replaced'] += 1
+            self.increment_stat('replaced')
             print(f"  {Colors.GREEN}✓ Video replaced successfully{Colors.ENDC}")
         else:
-            self.stats['failed'] += 1
+            self.increment_stat('failed')
             print(f"  {Colors.FAIL}✗ Failed to replace video{Colors.ENDC}")
         
-        self.stats['processed'] += 1
+        self.increment_stat('processed')
     
     def process_batch(self, nfo_files: List[Path]) -> None:
         """
@@ -317,19 +530,46 @@ class MusicVideoReplacer:
         print(f"Processing {len(nfo_files)} NFO file(s)")
         print("-" * 60)
         
-        for nfo_path in nfo_files:
-            try:
-                self.process_nfo(nfo_path)
-            except KeyboardInterrupt:
-                print(f"\n{Colors.WARNING}Process interrupted by user{Colors.ENDC}")
-                break
-            except Exception as e:
-                print(f"{Colors.FAIL}Error processing {nfo_path}: {e}{Colors.ENDC}")
-                self.stats['failed'] += 1
+        try:
+            if self.jobs > 1:
+                self.process_batch_parallel(nfo_files)
+            else:
+                for nfo_path in nfo_files:
+                    self.process_nfo_safely(nfo_path)
+        except KeyboardInterrupt:
+            print(f"\n{Colors.WARNING}Process interrupted by user{Colors.ENDC}")
         
         # Print summary
         self.print_summary()
     
+    def process_nfo_safely(self, nfo_path: Path) -> None:
+        """Process one NFO of a batch, counting unexpected errors as failures."""
+        try:
+            self.process_nfo(nfo_path)
+        except Exception as e:
+            print(f"{Colors.FAIL}Error processing {nfo_path}: {e}{Colors.ENDC}")
+            self.increment_stat('failed')
+    
+    def process_batch_parallel(self, nfo_files: List[Path]) -> None:
+        """
+        Process NFO files concurrently on a thread pool.
+        
+        Each NFO is dominated by the yt-dlp search and download, so threads
+        overlap network work across files. Output from concurrent files
+        interleaves.
+        
+        Args:
+            nfo_files: List of NFO file paths
+        """
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        try:
+            futures = [executor.submit(self.process_nfo_safely, nfo_path) for nfo_path in nfo_files]
+            for future in as_completed(futures):
+                future.result()
+        finally:
+            # On interrupt, drop files that have not started yet
+            executor.shutdown(wait=True, cancel_futures=True)
+    
     def print_summary(self) -> None:
         """Print processing summary."""
         print("\n" + "=" * 60)
@@ -353,6 +593,8 @@ Examples:
   %(prog)s /path/to/video1.nfo /path/to/video2.nfo
   %(prog)s /music_videos/artist/song.nfo --cookies cookies.txt
   %(prog)s *.nfo --dry-run
+  %(prog)s /music_videos/*/*.nfo --jobs 4
+  %(prog)s /music_videos/*/*.nfo --cache-ttl-days 7
         """
     )
     
@@ -374,12 +616,50 @@ Examples:
         help='Show what would be done without making changes'
     )
     
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Number of NFO files to process concurrently (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--in-process',
+        action='store_true',
+        help='Download through the yt_dlp package instead of the yt-dlp executable; '
+             'the download timeout is only checked on progress updates'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always search YouTube instead of reusing cached search results'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl-days',
+        type=float,
+        default=30,
+        help='Days a cached search result stays valid (default: 30)'
+    )
+    
+    parser.add_argument(
+        '--missing-only',
+        action='store_true',
+        help='Only search for NFOs whose video file is missing or that have no sources'
+    )
+    
     args = parser.parse_args()
     
     # Initialize replacer
     replacer = MusicVideoReplacer(
         cookies=args.cookies,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        jobs=args.jobs,
+        in_process=args.in_process,
+        use_cache=not args.no_cache,
+        cache_ttl_days=args.cache_ttl_days,
+        missing_only=args.missing_only
     )
     
     # Check dependencies
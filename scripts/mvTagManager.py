@@ -7,11 +7,15 @@ a specified tag from all NFO files found under each artist's directory.
 """
 
 import argparse
+import functools
 import os
+import shutil
 import sys
+import tempfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import unicodedata
 import re
 
@@ -26,6 +30,11 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+# Patterns used by normalize_name, compiled once
+NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+@functools.lru_cache(maxsize=8192)
 def normalize_name(name: str) -> str:
     """
     Normalize artist/file names to match mvOrganizer.py conventions.
@@ -44,13 +53,13 @@ def normalize_name(name: str) -> str:
     )
     
     # Remove special characters (keep only alphanumeric and spaces)
-    name = re.sub(r'[^a-z0-9\s]', '', name)
+    name = NON_ALNUM_RE.sub('', name)
     
     # Replace spaces with underscores
     name = name.replace(' ', '_')
     
     # Remove multiple underscores
-    name = re.sub(r'_+', '_', name)
+    name = MULTI_UNDERSCORE_RE.sub('_', name)
     
     # Strip leading/trailing underscores
     name = name.strip('_')
@@ -58,7 +67,11 @@ def normalize_name(name: str) -> str:
     return name
 
 class TagManager:
-    def __init__(self, base_dir: Path, artists_file: Path, tag: str, action: str, verbose: bool = False):
+    # Files handed to a worker process per round trip with --jobs
+    PARALLEL_CHUNK_FILES = 32
+    
+    def __init__(self, base_dir: Path, artists_file: Path, tag: str, action: str, verbose: bool = False,
+                 jobs: int = 1):
         """
         Initialize the tag manager.
         
@@ -68,12 +81,31 @@ class TagManager:
             tag: Tag to add or remove
             action: 'add' or 'remove'
             verbose: Enable verbose output
+            jobs: Number of worker processes for NFO files
         """
         self.base_dir = base_dir
         self.artists_file = artists_file
         self.tag = tag
         self.action = action
         self.verbose = verbose
+        self.jobs = max(1, jobs)
+        
+        # Worker pool shared by all artists while run() executes with jobs > 1
+        self.executor: Optional[ProcessPoolExecutor] = None
+        
+        # Names of the directories directly under base_dir, listed once on
+        # first use so artist lookups need no per-artist stat calls
+        self._artist_dir_names: Optional[Set[str]] = None
+        
+        # Raw bytes of the tag for the no-op prefilter in process_nfo_file, or
+        # None when the tag could be spelled differently in the file (padded,
+        # empty, non-ASCII, or containing characters XML may escape)
+        if tag and tag == tag.strip() and tag.isascii() and not any(c in tag for c in '&<>"\''):
+            self.tag_bytes = tag.encode('ascii')
+            self.tag_element_bytes = b'<tag>' + self.tag_bytes + b'</tag>'
+        else:
+            self.tag_bytes = None
+            self.tag_element_bytes = None
         
         # Statistics
         self.stats = {
@@ -89,22 +121,19 @@ class TagManager:
         
     def load_artists(self) -> List[str]:
         """Load artist names from file."""
-        artists = []
-        
         try:
-            with open(self.artists_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):  # Skip empty lines and comments
-                        artists.append(line)
+            # Read the whole file at once; universal newlines have already
+            # turned every line ending into '\n' by the time it is split
+            lines = self.artists_file.read_text(encoding='utf-8').split('\n')
         except FileNotFoundError:
             print(f"{Colors.RED}✗ Artists file not found: {self.artists_file}{Colors.RESET}")
             sys.exit(1)
         except Exception as e:
             print(f"{Colors.RED}✗ Error reading artists file: {e}{Colors.RESET}")
             sys.exit(1)
-            
-        return artists
+        
+        # Skip empty lines and comments
+        return [artist for line in lines if (artist := line.strip()) and not artist.startswith('#')]
     
     def find_artist_directory(self, artist: str) -> Path:
         """
@@ -117,13 +146,32 @@ class TagManager:
             Path to artist directory or None if not found
         """
         normalized_artist = normalize_name(artist)
-        artist_dir = self.base_dir / normalized_artist
         
-        if artist_dir.exists() and artist_dir.is_dir():
-            return artist_dir
+        if normalized_artist in self.list_artist_dir_names():
+            return self.base_dir / normalized_artist
         
         return None
     
+    def list_artist_dir_names(self) -> Set[str]:
+        """
+        Get the names of all directories directly under the base directory.
+        
+        A single listing answers every artist lookup, instead of two stat
+        calls per artist in the artists file.
+        """
+        if self._artist_dir_names is None:
+            names = set()
+            try:
+                with os.scandir(self.base_dir) as it:
+                    for entry in it:
+                        # Follow symlinks, as Path.is_dir() did
+                        if entry.is_dir():
+                            names.add(entry.name)
+            except OSError:
+                pass
+            self._artist_dir_names = names
+        return self._artist_dir_names
+    
     def find_nfo_files(self, artist_dir: Path) -> List[Path]:
         """
         Find all NFO files under an artist directory.
@@ -135,14 +183,36 @@ class TagManager:
         Returns:
             List of NFO file paths
         """
-        nfo_files = []
+        return [Path(path) for path in self._scan(str(artist_dir))]
+    
+    def _scan(self, path: str) -> Iterator[str]:
+        """
+        Recursively yield NFO file paths below a directory.
         
-        for root, dirs, files in os.walk(artist_dir):
-            for file in files:
-                if file.endswith('.nfo') and file != 'artist.nfo':
-                    nfo_files.append(Path(root) / file)
-                    
-        return nfo_files
+        Uses os.scandir directly so the cached DirEntry type information
+        answers the file/directory check without extra stat calls.
+        
+        Args:
+            path: Directory to scan
+            
+        Yields:
+            Path string of each NFO file, excluding artist.nfo
+        """
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith('.nfo') and entry.name != 'artist.nfo':
+                        yield entry.path
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            return
+        
+        # Descend after the files of this directory, matching os.walk order
+        for subdir in subdirs:
+            yield from self._scan(subdir)
     
     def process_nfo_file(self, nfo_path: Path) -> Tuple[bool, str]:
         """
@@ -155,16 +225,26 @@ class TagManager:
             Tuple of (modified, message)
         """
         try:
+            with open(nfo_path, 'rb') as f:
+                data = f.read()
+            
+            # Most files usually need no change; settle those from the raw
+            # bytes without parsing. Files settled this way are never parsed,
+            # so a malformed one is not counted as an error
+            if self.action == 'add' and self.tag_already_present(data):
+                self.stats['already_present'] += 1
+                return False, f"Tag '{self.tag}' already present"
+            if self.action == 'remove' and self.tag_absent(data):
+                self.stats['not_present'] += 1
+                return False, f"Tag '{self.tag}' not present"
+            
             # Parse the XML file
-            tree = ET.parse(nfo_path)
-            root = tree.getroot()
+            root = ET.fromstring(data)
+            tree = ET.ElementTree(root)
             
             # Find existing tags
-            existing_tags = set()
             tag_elements = root.findall('tag')
-            for elem in tag_elements:
-                if elem.text:
-                    existing_tags.add(elem.text.strip())
+            existing_tags = {elem.text.strip() for elem in tag_elements if elem.text}
             
             modified = False
             message = ""
@@ -196,9 +276,12 @@ class TagManager:
             
             # Save the file if modified
             if modified:
-                # Pretty print the XML
-                self.indent_xml(root)
-                tree.write(nfo_path, encoding='UTF-8', xml_declaration=True)
+                # Pretty print the XML; the root keeps its trailing newline
+                # so the file still ends with one
+                ET.indent(tree, space="    ")
+                root.tail = "\n"
+                data = ET.tostring(root, encoding='UTF-8', xml_declaration=True)
+                self.replace_file(nfo_path, data)
                 self.stats['nfo_files_modified'] += 1
                 
             return modified, message
@@ -210,27 +293,61 @@ class TagManager:
             self.stats['errors'] += 1
             return False, f"Error: {e}"
     
-    def indent_xml(self, elem, level=0):
+    def replace_file(self, nfo_path: Path, data: bytes) -> None:
         """
-        Recursively add indentation to XML elements for pretty printing.
+        Atomically replace a file's contents, keeping its permissions.
         
         Args:
-            elem: XML element
-            level: Current indentation level
+            nfo_path: Path to NFO file
+            data: New file contents
         """
-        i = "\n" + level * "    "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "    "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for elem in elem:
-                self.indent_xml(elem, level + 1)
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
+        directory, name = os.path.split(nfo_path)
+        with tempfile.NamedTemporaryFile(dir=directory or '.', prefix=f'.{name}.',
+                                         suffix='.tmp', delete=False) as f:
+            f.write(data)
+        
+        try:
+            # Keep the original file's permissions rather than the temp file's 0600
+            shutil.copymode(nfo_path, f.name)
+            os.replace(f.name, nfo_path)
+        except OSError:
+            os.unlink(f.name)
+            raise
+    
+    def is_plain_xml(self, data: bytes) -> bool:
+        """
+        Check whether NFO bytes can be searched for tag text directly.
+        
+        Comments, CDATA and DOCTYPE entities (all starting with '<!'),
+        character references, and UTF-16/32 encodings (which contain NUL
+        bytes) can all hide or fake a tag's text in the raw bytes.
+        """
+        return b'<!' not in data and b'&#' not in data and b'\x00' not in data
+    
+    def tag_already_present(self, data: bytes) -> bool:
+        """
+        Check from raw bytes that the tag is certainly present already.
+        
+        Only a <tag> element directly under the root counts, as with
+        root.findall('tag'). When every '>' in the file ends markup, the
+        depth of the first match follows from counting the opening,
+        closing and self-closing tags before it; otherwise the file is
+        left to the parser.
+        """
+        if self.tag_element_bytes is None or not self.is_plain_xml(data):
+            return False
+        pos = data.find(self.tag_element_bytes)
+        if pos < 0 or data.count(b'<') != data.count(b'>'):
+            return False
+        closes = data.count(b'</', 0, pos)
+        opens = data.count(b'<', 0, pos) - closes - data.count(b'<?', 0, pos)
+        return opens - closes - data.count(b'/>', 0, pos) == 1
+    
+    def tag_absent(self, data: bytes) -> bool:
+        """Check from raw bytes that the tag is certainly not present."""
+        return (self.tag_bytes is not None
+                and self.tag_bytes not in data
+                and self.is_plain_xml(data))
     
     def process_artist(self, artist: str) -> int:
         """
@@ -265,11 +382,15 @@ class TagManager:
         if self.verbose:
             print(f"  Found {len(nfo_files)} NFO file(s) in {artist_dir}")
         
-        # Process each NFO file
+        # Process each NFO file; results arrive in file order either way
+        if self.executor is not None:
+            results = self.process_nfo_files_parallel(nfo_files)
+        else:
+            results = map(self.process_nfo_file, nfo_files)
+        
         modified_count = 0
-        for nfo_path in nfo_files:
+        for nfo_path, (modified, message) in zip(nfo_files, results):
             relative_path = nfo_path.relative_to(self.base_dir)
-            modified, message = self.process_nfo_file(nfo_path)
             
             if modified:
                 modified_count += 1
@@ -280,6 +401,27 @@ class TagManager:
         
         return modified_count
     
+    def process_nfo_files_parallel(self, nfo_files: List[Path]) -> Iterator[Tuple[bool, str]]:
+        """
+        Process NFO files on the worker pool.
+        
+        Each file's parse, edit and rewrite is independent CPU work, so
+        worker processes run process_nfo_file on their own tag manager and
+        return its result with the stats it changed, which are merged here.
+        
+        Args:
+            nfo_files: NFO file paths
+            
+        Yields:
+            (modified, message) for each file, in input order
+        """
+        for modified, message, stats in self.executor.map(
+            _process_in_worker, nfo_files, chunksize=self.PARALLEL_CHUNK_FILES
+        ):
+            for key, value in stats.items():
+                self.stats[key] += value
+            yield modified, message
+    
     def run(self):
         """Execute the tag management operation."""
         # Load artists
@@ -294,7 +436,26 @@ class TagManager:
         print(f"\n{Colors.BOLD}{action_text} tag '{self.tag}' for {len(artists)} artist(s){Colors.RESET}")
         print(f"Base directory: {self.base_dir}\n")
         
-        # Process each artist
+        # Process each artist, sharing one worker pool across all of them
+        if self.jobs > 1:
+            with ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_worker,
+                initargs=(str(self.base_dir), str(self.artists_file), self.tag, self.action)
+            ) as executor:
+                self.executor = executor
+                try:
+                    self.process_artists(artists)
+                finally:
+                    self.executor = None
+        else:
+            self.process_artists(artists)
+        
+        # Print summary
+        self.print_summary()
+    
+    def process_artists(self, artists: List[str]) -> None:
+        """Process each artist in turn, printing per-artist results."""
         for artist in artists:
             print(f"{Colors.BLUE}Processing: {artist}{Colors.RESET}")
             modified_count = self.process_artist(artist)
@@ -303,9 +464,6 @@ class TagManager:
                 print(f"  {Colors.GREEN}✓ Modified {modified_count} file(s){Colors.RESET}")
             
             self.stats['artists_processed'] += 1
-        
-        # Print summary
-        self.print_summary()
     
     def print_summary(self):
         """Print operation summary."""
@@ -333,6 +491,29 @@ class TagManager:
         if self.stats['errors'] > 0:
             sys.exit(1)
 
+# Tag manager owned by each worker process, set up once by _init_worker
+_worker_manager: Optional[TagManager] = None
+
+def _init_worker(base_dir: str, artists_file: str, tag: str, action: str) -> None:
+    """Create the per-process tag manager used by _process_in_worker."""
+    global _worker_manager
+    _worker_manager = TagManager(Path(base_dir), Path(artists_file), tag, action)
+
+def _process_in_worker(nfo_path: Path) -> Tuple[bool, str, Dict[str, int]]:
+    """
+    Process one NFO file inside a worker process.
+    
+    Args:
+        nfo_path: Path to NFO file
+        
+    Returns:
+        Tuple of (modified, message, stats changed by this file)
+    """
+    manager = _worker_manager
+    manager.stats = dict.fromkeys(manager.stats, 0)
+    modified, message = manager.process_nfo_file(nfo_path)
+    return modified, message, manager.stats
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -348,6 +529,9 @@ Examples:
     
   Add tag with verbose output:
     python3 mvTagManager.py /media/MusicVideos artists.txt --add "featured" --verbose
+    
+  Spread NFO work over four processes:
+    python3 mvTagManager.py /media/MusicVideos artists.txt --add "80s" --jobs 4
 
 Artist File Format:
   One artist name per line. Lines starting with # are treated as comments.
@@ -382,6 +566,10 @@ Artist File Format:
     parser.add_argument('-v', '--verbose',
                        action='store_true',
                        help='Show detailed output for each file')
+    parser.add_argument('-j', '--jobs',
+                       type=int,
+                       default=1,
+                       help='Number of worker processes for NFO files (default: 1)')
     
     args = parser.parse_args()
     
@@ -414,7 +602,8 @@ Artist File Format:
         artists_file=artists_file,
         tag=tag,
         action=action,
-        verbose=args.verbose
+        verbose=args.verbose,
+        jobs=args.jobs
     )
     
     try:
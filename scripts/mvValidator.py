@@ -7,11 +7,17 @@ Designed to be modular and extensible for adding new validation rules.
 """
 
 import argparse
+import functools
+import hashlib
+import json
 import os
 import sys
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 from collections import defaultdict
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 
 # ANSI color codes for terminal output
@@ -27,6 +33,15 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Separators dropped from video names when looking for duplicates
+NAME_SEPARATORS = str.maketrans('', '', '_- ')
+
+# System directories skipped by --skip-hidden along with any directory whose
+# name starts with a dot (.git, .stversions, .Trashes, ...)
+SKIP_DIRS = frozenset({'@eaDir', '#recycle', '$RECYCLE.BIN', 'lost+found',
+                       'System Volume Information'})
+
+
 class ValidationRule(ABC):
     """Abstract base class for validation rules."""
     
@@ -55,50 +70,380 @@ class ValidationRule(ABC):
 
 
 class FileSystemSnapshot:
-    """Snapshot of the file system structure for validation."""
-    
-    def __init__(self, base_path: Path):
+    """
+    Snapshot of the file system structure for validation.
+    
+    Paths are stored as plain strings, with the parent directory and stem of
+    each video and NFO file kept in parallel lists, so the built-in rules
+    never allocate Path objects in their loops. The Path-valued attributes
+    (video_files, nfo_files, ...) are built from the strings on first access
+    for rules written against pathlib.
+    """
+    
+    # Tree levels with at least this many directories are listed on a
+    # thread pool of SCAN_THREADS workers
+    MIN_PARALLEL_SCAN_DIRS = 64
+    SCAN_THREADS = 16
+    
+    # Directory listings persist across runs in the user's cache directory
+    CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mvvalidator'
+    CACHE_VERSION = 1
+    
+    def __init__(self, base_path: Path, use_cache: bool = False, skip_hidden: bool = False):
         """
         Create a snapshot of the file system.
         
         Args:
             base_path: Base path to scan
+            use_cache: Reuse the directory listings saved by a previous run
+                when no directory in the tree has changed since
+            skip_hidden: Do not descend into hidden directories or the
+                system directories in SKIP_DIRS
         """
         self.base_path = base_path
-        self.video_files = []  # List of .mp4 files
-        self.nfo_files = []    # List of .nfo files
-        self.artist_nfo_files = []  # List of artist.nfo files
-        self.artist_directories = set()  # Set of artist directory paths
-        self.other_files = []  # List of other files
-        self.all_directories = set()  # All directories found
+        self.use_cache = use_cache
+        self.skip_hidden = skip_hidden
+        self.from_cache = False  # Whether the listings came from the cache
+        # Prefix stripped from scanned paths to make them relative to base_path
+        self.base_str = str(base_path).rstrip(os.sep) + os.sep
+        self.video_paths = []  # List of .mp4 files
+        self.video_parents = []  # Parent directory of each .mp4 file
+        self.video_stems = []  # Filename of each .mp4 file without extension
+        self.nfo_paths = []    # List of .nfo files
+        self.nfo_parents = []  # Parent directory of each .nfo file
+        self.nfo_stems = []    # Filename of each .nfo file without extension
+        self.artist_nfo_paths = []  # List of artist.nfo files
+        self.artist_directory_paths = []  # List of artist directory paths
+        self.other_paths = []  # List of other files
+        self.files_by_ext = defaultdict(list)  # Other files by lowercase extension
+        self.directory_paths = []  # All directories found, each listed once
+        self.dirs_with_files = set()  # Directories with a file anywhere below them
         
         self._scan_directory()
     
+    @functools.cached_property
+    def video_files(self) -> List[Path]:
+        """List of .mp4 files as Path objects."""
+        return [Path(p) for p in self.video_paths]
+    
+    @functools.cached_property
+    def nfo_files(self) -> List[Path]:
+        """List of .nfo files as Path objects."""
+        return [Path(p) for p in self.nfo_paths]
+    
+    @functools.cached_property
+    def artist_nfo_files(self) -> List[Path]:
+        """List of artist.nfo files as Path objects."""
+        return [Path(p) for p in self.artist_nfo_paths]
+    
+    @functools.cached_property
+    def other_files(self) -> List[Path]:
+        """List of other files as Path objects."""
+        return [Path(p) for p in self.other_paths]
+    
+    @functools.cached_property
+    def artist_directories(self) -> Set[Path]:
+        """Set of artist directories as Path objects."""
+        return {Path(p) for p in self.artist_directory_paths}
+    
+    @functools.cached_property
+    def all_directories(self) -> Set[Path]:
+        """Set of all directories as Path objects."""
+        return {Path(p) for p in self.directory_paths}
+    
+    def relative_path(self, path: str) -> str:
+        """
+        Return a path string relative to the base path.
+        
+        Equivalent to Path.relative_to for paths found by the scan, using
+        string slicing instead of comparing path parts.
+        
+        Args:
+            path: Path string under base_path
+        
+        Returns:
+            Relative path string, or '.' for the base path itself
+        """
+        if path.startswith(self.base_str):
+            return path[len(self.base_str):] or '.'
+        return path
+    
+    @functools.cached_property
+    def video_keys(self) -> List[str]:
+        """Path without extension of each .mp4 file, parallel to video_paths."""
+        join = os.path.join
+        return [join(parent, stem) for parent, stem in zip(self.video_parents, self.video_stems)]
+    
+    @functools.cached_property
+    def nfo_keys(self) -> List[str]:
+        """Path without extension of each .nfo file, parallel to nfo_paths."""
+        join = os.path.join
+        return [join(parent, stem) for parent, stem in zip(self.nfo_parents, self.nfo_stems)]
+    
+    @functools.cached_property
+    def video_key_set(self) -> Set[str]:
+        """Set of video_keys, for checking whether an NFO has a video."""
+        return set(self.video_keys)
+    
+    @functools.cached_property
+    def nfo_key_set(self) -> Set[str]:
+        """Set of nfo_keys, for checking whether a video has an NFO."""
+        return set(self.nfo_keys)
+    
+    @functools.cached_property
+    def artist_nfo_dirs(self) -> Set[str]:
+        """Set of directories that contain an artist.nfo file."""
+        return {os.path.dirname(path) for path in self.artist_nfo_paths}
+    
+    @functools.cached_property
+    def unpaired_files(self) -> Tuple[List[str], List[str]]:
+        """
+        Pair video and NFO files by their path without extension.
+        
+        Both directions are worked out together from the shared key sets,
+        so the two orphan rules share a single pass.
+        
+        Returns:
+            Tuple of (NFO paths without a video, video paths without an NFO),
+            each in scan order
+        """
+        video_key_set = self.video_key_set
+        nfo_key_set = self.nfo_key_set
+        
+        orphan_nfos = [path for path, key in zip(self.nfo_paths, self.nfo_keys) if key not in video_key_set]
+        orphan_videos = [path for path, key in zip(self.video_paths, self.video_keys) if key not in nfo_key_set]
+        return orphan_nfos, orphan_videos
+    
+    @property
+    def cache_file(self) -> Path:
+        """Cache file holding the directory listings for this base path."""
+        # Scanned paths are built from base_path as given, so a relative base
+        # is keyed by the working directory as well
+        base_str = str(self.base_path)
+        key = f"{os.path.abspath(base_str)}\0{base_str}\0{int(self.skip_hidden)}"
+        return self.CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+    
     def _scan_directory(self):
         """Scan the directory and categorize files."""
-        for root, dirs, files in os.walk(self.base_path):
-            root_path = Path(root)
+        base_str = str(self.base_path)
+        
+        listings = None
+        if self.use_cache:
+            listings = self._load_cached_listings()
+            self.from_cache = listings is not None
+        
+        if listings is None:
+            listings, ctimes = self._list_tree(base_str)
+            if self.use_cache:
+                self._save_cached_listings(listings, ctimes)
+        
+        # Record the listings in os.walk's top-down order; subdirectories are
+        # pushed in reverse so they are popped in listing order
+        pending = [base_str]
+        
+        while pending:
+            root = pending.pop()
+            listing = listings[root]
+            if listing is None:
+                # Unreadable directories are skipped, as os.walk does
+                continue
+            files, subdirs = listing
             
             # Track all directories
-            self.all_directories.add(root_path)
+            self.directory_paths.append(root)
             
             # Check if this is potentially an artist directory
             # (direct child of base_path)
-            if root_path.parent == self.base_path:
-                self.artist_directories.add(root_path)
+            if Path(root).parent == self.base_path:
+                self.artist_directory_paths.append(root)
             
-            for file in files:
-                file_path = root_path / file
-                
+            for file, file_path in files:
+                # Stems follow Path.stem: a name that is only the extension keeps it
                 if file == 'artist.nfo':
-                    self.artist_nfo_files.append(file_path)
+                    self.artist_nfo_paths.append(file_path)
                 elif file.endswith('.nfo'):
-                    self.nfo_files.append(file_path)
+                    self.nfo_paths.append(file_path)
+                    self.nfo_parents.append(root)
+                    self.nfo_stems.append(file[:-4] if len(file) > 4 else file)
                 elif file.endswith('.mp4'):
-                    self.video_files.append(file_path)
+                    self.video_paths.append(file_path)
+                    self.video_parents.append(root)
+                    self.video_stems.append(file[:-4] if len(file) > 4 else file)
                 else:
-                    # Any other file type
-                    self.other_files.append(file_path)
+                    # Any other file type, also grouped by its extension as
+                    # Path.suffix would give it
+                    self.other_paths.append(file_path)
+                    dot = file.rfind('.')
+                    ext = file[dot:].lower() if 0 < dot < len(file) - 1 else ''
+                    self.files_by_ext[ext].append(file_path)
+            
+            pending.extend(reversed(subdirs))
+        
+        # Directories were recorded parents first, so walking them backwards
+        # settles every subdirectory before its parent
+        dirs_with_files = self.dirs_with_files
+        for directory in reversed(self.directory_paths):
+            files, subdirs = listings[directory]
+            if files or any(subdir in dirs_with_files for subdir in subdirs):
+                dirs_with_files.add(directory)
+    
+    def _list_tree(self, base_str: str) -> Tuple[Dict[str, Optional[tuple]], Dict[str, Optional[int]]]:
+        """
+        List every directory in the tree below base_str.
+        
+        The tree is listed one level at a time. Listings are bound by
+        directory syscalls (a round trip each on network mounts), so levels
+        with many directories are listed concurrently.
+        
+        Args:
+            base_str: Directory to start from
+        
+        Returns:
+            Tuple of (listing of each directory as returned by list_directory,
+            status change time of each directory taken before it was listed)
+        """
+        listings = {}
+        ctimes = {}
+        level = [base_str]
+        with ThreadPoolExecutor(max_workers=self.SCAN_THREADS) as executor:
+            while level:
+                if len(level) >= self.MIN_PARALLEL_SCAN_DIRS:
+                    results = executor.map(self._stat_and_list, level)
+                else:
+                    results = map(self._stat_and_list, level)
+                
+                next_level = []
+                for directory, (ctime, listing) in zip(level, results):
+                    ctimes[directory] = ctime
+                    listings[directory] = listing
+                    if listing is not None:
+                        next_level.extend(listing[1])
+                level = next_level
+        
+        return listings, ctimes
+    
+    def _stat_and_list(self, path: str) -> Tuple[Optional[int], Optional[tuple]]:
+        """List a directory, recording its status change time beforehand."""
+        # Statting first means a change made while listing is caught next run
+        ctime = self.directory_ctime(path) if self.use_cache else None
+        return ctime, self.list_directory(path, self.skip_hidden)
+    
+    @staticmethod
+    def directory_ctime(path: str) -> Optional[int]:
+        """Return a directory's status change time in ns, or None if it cannot be read."""
+        try:
+            return os.stat(path).st_ctime_ns
+        except OSError:
+            return None
+    
+    def _load_cached_listings(self) -> Optional[Dict[str, Optional[tuple]]]:
+        """
+        Load the cached directory listings if the tree is unchanged.
+        
+        A directory's status change time moves whenever an entry is added,
+        removed or renamed in it, and also when its permissions change, so
+        the listings are still valid when every cached directory has the
+        status change time recorded at scan time.
+        
+        Returns:
+            Listings by directory, or None if there is no usable cache
+        """
+        try:
+            with open(self.cache_file, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.CACHE_VERSION:
+                return None
+            ctimes = data['ctimes']
+            listings = data['listings']
+        except (OSError, ValueError, KeyError, AttributeError):
+            return None
+        
+        directories = list(ctimes)
+        if len(directories) >= self.MIN_PARALLEL_SCAN_DIRS:
+            with ThreadPoolExecutor(max_workers=self.SCAN_THREADS) as executor:
+                current = list(executor.map(self.directory_ctime, directories))
+        else:
+            current = [self.directory_ctime(d) for d in directories]
+        
+        for directory, ctime in zip(directories, current):
+            if ctime is None or ctime != ctimes[directory]:
+                return None
+        
+        return listings
+    
+    def _save_cached_listings(self, listings: Dict[str, Optional[tuple]],
+                              ctimes: Dict[str, Optional[int]]):
+        """
+        Save the directory listings for the next run.
+        
+        The cache is only an optimization, so failing to write it is ignored.
+        
+        Args:
+            listings: Listing of each directory as returned by list_directory
+            ctimes: Status change time of each directory before it was listed
+        """
+        if None in ctimes.values():
+            # A directory that could not be statted cannot be checked later
+            return
+        
+        data = {'version': self.CACHE_VERSION, 'ctimes': ctimes, 'listings': listings}
+        cache_file = self.cache_file
+        tmp_path = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_file.parent,
+                                             suffix='.tmp', delete=False) as tmp:
+                tmp_path = tmp.name
+                json.dump(data, tmp)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def list_directory(path: str, skip_hidden: bool = False) -> Optional[Tuple[List[Tuple[str, str]], List[str]]]:
+        """
+        List one directory, splitting its entries into files and subdirectories.
+        
+        Entries are classified from the cached directory entry types, with no
+        per-file stat call.
+        
+        Args:
+            path: Directory to list
+            skip_hidden: Leave hidden directories and those in SKIP_DIRS out
+                of the subdirectories, so they are never listed
+        
+        Returns:
+            Tuple of ((name, path) of each file, paths of subdirectories to
+            descend into), or None if the directory cannot be read
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return None
+        
+        files = []
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            
+            if is_dir:
+                if skip_hidden and (entry.name.startswith('.') or entry.name in SKIP_DIRS):
+                    continue
+                # Symlinked directories are not descended into
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                files.append((entry.name, entry.path))
+        
+        return files, subdirs
 
 
 class OrphanNfoRule(ValidationRule):
@@ -113,22 +458,11 @@ class OrphanNfoRule(ValidationRule):
     def validate(self, file_system: FileSystemSnapshot) -> List[str]:
         issues = []
         
-        # Create a set of video file stems (without extension)
-        video_stems = set()
-        for video_path in file_system.video_files:
-            # Get the full path without extension
-            stem_path = video_path.parent / video_path.stem
-            video_stems.add(str(stem_path))
-        
-        # Check each NFO file
-        for nfo_path in file_system.nfo_files:
-            # Get the full path without extension
-            stem_path = nfo_path.parent / nfo_path.stem
-            
-            # Check if there's a matching video file
-            if str(stem_path) not in video_stems:
-                relative_path = nfo_path.relative_to(file_system.base_path)
-                issues.append(f"NFO without video: {relative_path}")
+        # NFO files with no video of the same name in the same directory
+        orphan_nfos, _ = file_system.unpaired_files
+        for nfo_path in orphan_nfos:
+            relative_path = file_system.relative_path(nfo_path)
+            issues.append(f"NFO without video: {relative_path}")
         
         return issues
 
@@ -145,22 +479,11 @@ class OrphanVideoRule(ValidationRule):
     def validate(self, file_system: FileSystemSnapshot) -> List[str]:
         issues = []
         
-        # Create a set of NFO file stems (without extension)
-        nfo_stems = set()
-        for nfo_path in file_system.nfo_files:
-            # Get the full path without extension
-            stem_path = nfo_path.parent / nfo_path.stem
-            nfo_stems.add(str(stem_path))
-        
-        # Check each video file
-        for video_path in file_system.video_files:
-            # Get the full path without extension
-            stem_path = video_path.parent / video_path.stem
-            
-            # Check if there's a matching NFO file
-            if str(stem_path) not in nfo_stems:
-                relative_path = video_path.relative_to(file_system.base_path)
-                issues.append(f"Video without NFO: {relative_path}")
+        # Video files with no NFO of the same name in the same directory
+        _, orphan_videos = file_system.unpaired_files
+        for video_path in orphan_videos:
+            relative_path = file_system.relative_path(video_path)
+            issues.append(f"Video without NFO: {relative_path}")
         
         return issues
 
@@ -178,22 +501,28 @@ class MissingArtistNfoRule(ValidationRule):
         issues = []
         
         # Get directories that contain artist.nfo files
-        artist_nfo_dirs = set()
-        for artist_nfo_path in file_system.artist_nfo_files:
-            artist_nfo_dirs.add(artist_nfo_path.parent)
+        artist_nfo_dirs = file_system.artist_nfo_dirs
+        
+        # Map each directory holding videos to the top-level directory it is
+        # under, so every artist directory with videos (to avoid false
+        # positives) is found in one pass over the video directories
+        base_dir = str(file_system.base_path)
+        artists_with_videos = set()
+        for parent in set(file_system.video_parents):
+            if parent != base_dir:
+                artist = file_system.relative_path(parent).split(os.sep, 1)[0]
+                artists_with_videos.add(os.path.join(base_dir, artist))
+        
+        # The base directory holds every video; it only counts as an artist
+        # directory when it is its own parent, such as '.'
+        if file_system.video_parents:
+            artists_with_videos.add(base_dir)
         
         # Check each artist directory
-        for artist_dir in file_system.artist_directories:
-            if artist_dir not in artist_nfo_dirs:
-                # Check if this directory has any video files (to avoid false positives)
-                has_videos = any(
-                    video_path.parent.is_relative_to(artist_dir) or video_path.parent == artist_dir
-                    for video_path in file_system.video_files
-                )
-                
-                if has_videos:
-                    relative_path = artist_dir.relative_to(file_system.base_path)
-                    issues.append(f"Artist directory without artist.nfo: {relative_path}")
+        for artist_dir in file_system.artist_directory_paths:
+            if artist_dir not in artist_nfo_dirs and artist_dir in artists_with_videos:
+                relative_path = file_system.relative_path(artist_dir)
+                issues.append(f"Artist directory without artist.nfo: {relative_path}")
         
         return issues
 
@@ -210,18 +539,12 @@ class UnexpectedFilesRule(ValidationRule):
     def validate(self, file_system: FileSystemSnapshot) -> List[str]:
         issues = []
         
-        # Group other files by extension
-        files_by_ext = defaultdict(list)
-        for file_path in file_system.other_files:
-            ext = file_path.suffix.lower()
-            files_by_ext[ext].append(file_path)
-        
         # Report files grouped by extension
-        for ext, files in sorted(files_by_ext.items()):
+        for ext, files in sorted(file_system.files_by_ext.items()):
             # Show first few examples of each type
             examples = files[:3]
             for file_path in examples:
-                relative_path = file_path.relative_to(file_system.base_path)
+                relative_path = file_system.relative_path(file_path)
                 issues.append(f"Unexpected file ({ext or 'no extension'}): {relative_path}")
             
             # If there are more, add a summary
@@ -243,25 +566,13 @@ class EmptyDirectoriesRule(ValidationRule):
     
     def validate(self, file_system: FileSystemSnapshot) -> List[str]:
         issues = []
-        
-        # Track directories with files
-        dirs_with_files = set()
-        
-        # Add parent directories of all files
-        all_files = (file_system.video_files + file_system.nfo_files + 
-                    file_system.artist_nfo_files + file_system.other_files)
-        
-        for file_path in all_files:
-            # Add all parent directories up to base_path
-            current = file_path.parent
-            while current != file_system.base_path.parent:
-                dirs_with_files.add(current)
-                current = current.parent
+        base_dir = str(file_system.base_path)
+        dirs_with_files = file_system.dirs_with_files
         
         # Find empty directories
-        for directory in file_system.all_directories:
-            if directory not in dirs_with_files and directory != file_system.base_path:
-                relative_path = directory.relative_to(file_system.base_path)
+        for directory in file_system.directory_paths:
+            if directory not in dirs_with_files and directory != base_dir:
+                relative_path = file_system.relative_path(directory)
                 issues.append(f"Empty directory: {relative_path}")
         
         return issues
@@ -282,11 +593,10 @@ class DuplicateVideosRule(ValidationRule):
         # Group videos by normalized name
         videos_by_name = defaultdict(list)
         
-        for video_path in file_system.video_files:
-            # Normalize the filename for comparison
-            name = video_path.stem.lower()
-            # Remove common variations
-            name = name.replace('_', '').replace('-', '').replace(' ', '')
+        for video_path, stem in zip(file_system.video_paths, file_system.video_stems):
+            # Normalize the filename for comparison, removing common variations;
+            # separators go in a single translate pass
+            name = stem.lower().translate(NAME_SEPARATORS)
             name = name.replace('remastered', '').replace('hd', '')
             name = name.replace('official', '').replace('video', '')
             
@@ -296,7 +606,7 @@ class DuplicateVideosRule(ValidationRule):
         for name, videos in videos_by_name.items():
             if len(videos) > 1:
                 for video_path in videos:
-                    relative_path = video_path.relative_to(file_system.base_path)
+                    relative_path = file_system.relative_path(video_path)
                     issues.append(f"Potential duplicate: {relative_path}")
         
         return issues
@@ -305,16 +615,25 @@ class DuplicateVideosRule(ValidationRule):
 class MusicVideoValidator:
     """Main validator class that runs all validation rules."""
     
-    def __init__(self, base_path: str, verbose: bool = False):
+    def __init__(self, base_path: str, verbose: bool = False, use_cache: bool = False,
+                 quiet: bool = False, skip_hidden: bool = False):
         """
         Initialize the validator.
         
         Args:
             base_path: Base directory to validate
             verbose: Show verbose output
+            use_cache: Reuse the directory scan from a previous run when the
+                tree is unchanged
+            quiet: Do not print progress while validating
+            skip_hidden: Do not scan hidden directories or known system
+                directories such as @eaDir
         """
         self.base_path = Path(base_path)
         self.verbose = verbose
+        self.use_cache = use_cache
+        self.quiet = quiet
+        self.skip_hidden = skip_hidden
         self.rules = []
         self.stats = defaultdict(int)
         
@@ -355,25 +674,32 @@ class MusicVideoValidator:
         Returns:
             Dictionary mapping rule names to lists of issues
         """
-        print(f"\n{Colors.HEADER}Scanning directory: {self.base_path}{Colors.ENDC}")
+        if not self.quiet:
+            print(f"\n{Colors.HEADER}Scanning directory: {self.base_path}{Colors.ENDC}")
         
         # Create file system snapshot
-        file_system = FileSystemSnapshot(self.base_path)
+        file_system = FileSystemSnapshot(self.base_path, use_cache=self.use_cache,
+                                         skip_hidden=self.skip_hidden)
         
         # Print scan summary
-        print(f"\n{Colors.CYAN}Scan Summary:{Colors.ENDC}")
-        print(f"  Video files (.mp4): {len(file_system.video_files)}")
-        print(f"  NFO files: {len(file_system.nfo_files)}")
-        print(f"  Artist NFO files: {len(file_system.artist_nfo_files)}")
-        print(f"  Other files: {len(file_system.other_files)}")
-        print(f"  Artist directories: {len(file_system.artist_directories)}")
+        if not self.quiet:
+            summary = [f"\n{Colors.CYAN}Scan Summary:{Colors.ENDC}"]
+            if file_system.from_cache:
+                summary.append("  (unchanged since last scan, loaded from cache)")
+            summary.append(f"  Video files (.mp4): {len(file_system.video_paths)}")
+            summary.append(f"  NFO files: {len(file_system.nfo_paths)}")
+            summary.append(f"  Artist NFO files: {len(file_system.artist_nfo_paths)}")
+            summary.append(f"  Other files: {len(file_system.other_paths)}")
+            summary.append(f"  Artist directories: {len(file_system.artist_directory_paths)}")
+            sys.stdout.write('\n'.join(summary) + '\n')
         
         # Run each validation rule
         results = {}
-        print(f"\n{Colors.HEADER}Running validation rules...{Colors.ENDC}")
+        if not self.quiet:
+            print(f"\n{Colors.HEADER}Running validation rules...{Colors.ENDC}")
         
         for rule in self.rules:
-            if self.verbose:
+            if self.verbose and not self.quiet:
                 print(f"\nChecking: {rule.get_name()}")
                 print(f"  {rule.get_description()}")
             
@@ -381,7 +707,7 @@ class MusicVideoValidator:
             results[rule.get_name()] = issues
             self.stats[rule.get_name()] = len(issues)
             
-            if self.verbose and issues:
+            if self.verbose and not self.quiet and issues:
                 for issue in issues[:5]:  # Show first 5 issues in verbose mode
                     print(f"    {Colors.WARNING}• {issue}{Colors.ENDC}")
                 if len(issues) > 5:
@@ -396,33 +722,33 @@ class MusicVideoValidator:
         Args:
             results: Dictionary of validation results
         """
-        print(f"\n{Colors.HEADER}{Colors.BOLD}Validation Report{Colors.ENDC}")
-        print("=" * 70)
+        # The report is written in one go rather than a write per line
+        lines = [f"\n{Colors.HEADER}{Colors.BOLD}Validation Report{Colors.ENDC}", "=" * 70]
         
         total_issues = sum(len(issues) for issues in results.values())
         
         if total_issues == 0:
-            print(f"\n{Colors.GREEN}✓ No issues found! Directory structure is valid.{Colors.ENDC}")
+            lines.append(f"\n{Colors.GREEN}✓ No issues found! Directory structure is valid.{Colors.ENDC}")
         else:
-            print(f"\n{Colors.WARNING}Found {total_issues} total issue(s){Colors.ENDC}")
+            lines.append(f"\n{Colors.WARNING}Found {total_issues} total issue(s){Colors.ENDC}")
             
             for rule_name, issues in results.items():
                 if issues:
-                    print(f"\n{Colors.CYAN}{rule_name}:{Colors.ENDC} {Colors.FAIL}{len(issues)} issue(s){Colors.ENDC}")
+                    lines.append(f"\n{Colors.CYAN}{rule_name}:{Colors.ENDC} {Colors.FAIL}{len(issues)} issue(s){Colors.ENDC}")
                     
                     # Show all issues (or limit if too many)
                     display_limit = 10 if not self.verbose else len(issues)
                     for i, issue in enumerate(issues[:display_limit], 1):
-                        print(f"  {i}. {issue}")
+                        lines.append(f"  {i}. {issue}")
                     
                     if len(issues) > display_limit:
                         remaining = len(issues) - display_limit
-                        print(f"  ... and {remaining} more (use --verbose to see all)")
+                        lines.append(f"  ... and {remaining} more (use --verbose to see all)")
         
-        print("\n" + "=" * 70)
+        lines.append("\n" + "=" * 70)
         
         # Summary statistics
-        print(f"\n{Colors.HEADER}Summary by Rule:{Colors.ENDC}")
+        lines.append(f"\n{Colors.HEADER}Summary by Rule:{Colors.ENDC}")
         for rule in self.rules:
             rule_name = rule.get_name()
             count = self.stats[rule_name]
@@ -430,7 +756,9 @@ class MusicVideoValidator:
                 status = f"{Colors.GREEN}✓ PASS{Colors.ENDC}"
             else:
                 status = f"{Colors.FAIL}✗ FAIL ({count}){Colors.ENDC}"
-            print(f"  {rule_name}: {status}")
+            lines.append(f"  {rule_name}: {status}")
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def export_report(self, results: Dict[str, List[str]], output_file: str):
         """
@@ -444,7 +772,7 @@ class MusicVideoValidator:
             f.write("Music Video Directory Validation Report\n")
             f.write("=" * 70 + "\n")
             f.write(f"Directory: {self.base_path}\n")
-            f.write(f"Date: {os.popen('date').read().strip()}\n")
+            f.write(f"Date: {datetime.now().isoformat(timespec='seconds')}\n")
             f.write("=" * 70 + "\n\n")
             
             total_issues = sum(len(issues) for issues in results.values())
@@ -460,7 +788,8 @@ class MusicVideoValidator:
             f.write("\n" + "=" * 70 + "\n")
             f.write("End of Report\n")
         
-        print(f"\n{Colors.GREEN}Report exported to: {output_file}{Colors.ENDC}")
+        if not self.quiet:
+            print(f"\n{Colors.GREEN}Report exported to: {output_file}{Colors.ENDC}")
 
 
 def main():
@@ -483,6 +812,7 @@ Examples:
   %(prog)s /media/MusicVideos --verbose
   %(prog)s ./videos --export-report validation_report.txt
   %(prog)s ./videos --check-duplicates
+  %(prog)s /media/MusicVideos --cache --json
         """
     )
     
@@ -515,6 +845,24 @@ Examples:
         help='Skip checking for empty directories'
     )
     
+    parser.add_argument(
+        '--skip-hidden',
+        action='store_true',
+        help='Do not scan hidden directories (.git, .stversions, ...) or system directories such as @eaDir'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse the directory scan from the previous run when no directory has changed'
+    )
+    
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print the results as JSON instead of the formatted report'
+    )
+    
     args = parser.parse_args()
     
     # Validate directory exists
@@ -523,7 +871,9 @@ Examples:
         sys.exit(1)
     
     # Create validator
-    validator = MusicVideoValidator(args.directory, verbose=args.verbose)
+    validator = MusicVideoValidator(args.directory, verbose=args.verbose,
+                                    use_cache=args.cache, quiet=args.json,
+                                    skip_hidden=args.skip_hidden)
     
     # Add optional duplicate checking
     if args.check_duplicates:
@@ -537,7 +887,10 @@ Examples:
     results = validator.validate()
     
     # Print report
-    validator.print_report(results)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        validator.print_report(results)
     
     # Export report if requested
     if args.export_report:
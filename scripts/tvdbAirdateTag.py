@@ -7,9 +7,9 @@ Example filename:
 
 What it does:
   1) Parses YYYY-MM-DD from the filename
-  2) Logs into TheTVDB v4 with your API key (and optional PIN)
+  2) Logs into TheTVDB v4 with your API key (and optional PIN), reusing a cached token when possible
   3) Looks up the series by slug to get its ID
-  4) Pages through "official" episodes and finds an episode whose airdate matches
+  4) Pages through "official" episodes once (cached for a day) and finds an episode whose airdate matches
   5) Prints a suggested new name, and optionally renames on disk
 
 Environment:
@@ -24,6 +24,8 @@ Notes:
   - Uses /series/{id}/episodes/official?page=N (no /{lang} in path).
   - Normalizes payloads where "data" may be a list or a dict containing "episodes".
   - Falls back to /episodes/{id} if the list yields IDs instead of objects.
+  - Caches the token, the airdate index and ETag-validated API responses under
+    $XDG_CACHE_HOME/tvdb (~/.cache/tvdb); pass --refresh to re-fetch the episode list.
 """
 
 import os
@@ -31,46 +33,151 @@ import re
 import sys
 import json
 import time
+import hashlib
+import threading
 import argparse
 import pathlib
 import requests
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE = "https://api4.thetvdb.com/v4"
 DATE_RX = re.compile(r"(?P<date>\d{4}-\d{2}-\d{2})")
 
+# Episode lists are cached per series so re-runs within a day skip the API
+CACHE_DIR = pathlib.Path(os.getenv("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache") / "tvdb"
+CACHE_TTL = 24 * 3600  # seconds
 
-def tvdb_login(apikey: str, pin: typing.Optional[str] = None) -> str:
+# Episode pages and records are kept with their ETag/Last-Modified so later
+# fetches can be conditional requests
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+
+# TheTVDB v4 tokens last about a month; reuse a cached one for a little less
+TOKEN_TTL = 25 * 24 * 3600  # seconds
+
+# Episode pages after the first are fetched this many at a time; matches the
+# session's connection pool size
+PAGE_FETCH_THREADS = 8
+
+# Renames are issued this many at a time; each one waits on a server round
+# trip when the files are on a network mount
+RENAME_THREADS = 16
+
+
+def make_session() -> requests.Session:
+    """
+    Create the HTTP session shared by every TVDB call.
+    Keeps the connection to the API open between requests and retries
+    rate-limited or transient gateway errors with backoff.
+    """
+    session = requests.Session()
+    retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=retries))
+    return session
+
+
+def tvdb_login(session: requests.Session, apikey: str, pin: typing.Optional[str] = None) -> str:
     """Return a bearer token for TheTVDB v4."""
     payload: typing.Dict[str, typing.Any] = {"apikey": apikey}
     if pin:
         payload["pin"] = pin
-    r = requests.post(f"{API_BASE}/login", json=payload, timeout=20)
+    r = session.post(f"{API_BASE}/login", json=payload, timeout=20)
     r.raise_for_status()
     data = r.json()
     return data["data"]["token"]
 
 
-def get_series_id_by_slug(token: str, slug: str) -> int:
+def save_cache_json(path: pathlib.Path, obj: typing.Any, mode: int = 0o644) -> None:
+    """
+    Write a cache file atomically, creating its directory as needed.
+    The cache only saves time, so failing to write it is not an error.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per thread, since pages are saved from the fetch pool
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(obj, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def get_json(session: requests.Session, url: str, timeout: float) -> typing.Any:
+    """
+    GET a JSON document, revalidating the copy saved by an earlier run.
+    Responses carrying an ETag or Last-Modified header are saved with it, and the
+    next request for the URL is made conditional; a 304 reuses the saved body.
+    """
+    cache_path = HTTP_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+    cached: typing.Optional[typing.Dict[str, typing.Any]] = None
+    headers: typing.Dict[str, str] = {}
+    try:
+        with cache_path.open(encoding="utf-8") as f:
+            cached = json.load(f)
+        # Only a saved body can answer a 304, so without one the request is unconditional
+        if "body" in cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+    except (OSError, ValueError, AttributeError, TypeError):
+        cached = None
+
+    r = session.get(url, headers=headers, timeout=timeout)
+    if r.status_code == 304 and cached is not None and "body" in cached:
+        return cached["body"]
+    r.raise_for_status()
+    body = r.json()
+
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+    if etag or last_modified:
+        save_cache_json(cache_path, {"etag": etag, "last_modified": last_modified, "body": body})
+    return body
+
+
+def get_token(
+    session: requests.Session,
+    apikey: str,
+    pin: typing.Optional[str] = None,
+    refresh: bool = False,
+) -> str:
+    """
+    Return a bearer token, reusing the one cached by an earlier run while it is within TOKEN_TTL.
+    The cache records a hash of the API key and PIN, so a different key logs in afresh.
+    """
+    cache_path = CACHE_DIR / "token.json"
+    key_hash = hashlib.sha256(f"{apikey}\0{pin or ''}".encode("utf-8")).hexdigest()
+    if not refresh:
+        try:
+            with cache_path.open(encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached["key"] == key_hash and time.time() - cached["saved_at"] < TOKEN_TTL:
+                return cached["token"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    token = tvdb_login(session, apikey, pin)
+
+    # The token is a credential, so the cache file is readable by the owner only
+    save_cache_json(cache_path, {"key": key_hash, "token": token, "saved_at": time.time()}, mode=0o600)
+    return token
+
+
+def get_series_id_by_slug(session: requests.Session, slug: str) -> int:
     """Resolve a TheTVDB series ID from a series slug."""
-    r = requests.get(
-        f"{API_BASE}/series/slug/{slug}",
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=20,
-    )
+    r = session.get(f"{API_BASE}/series/slug/{slug}", timeout=20)
     r.raise_for_status()
     return int(r.json()["data"]["id"])
 
 
-def get_episode(token: str, episode_id: int) -> typing.Optional[typing.Dict[str, typing.Any]]:
+def get_episode(session: requests.Session, episode_id: int) -> typing.Optional[typing.Dict[str, typing.Any]]:
     """Fetch a single episode record by ID."""
-    r = requests.get(
-        f"{API_BASE}/episodes/{episode_id}",
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=20,
-    )
-    r.raise_for_status()
-    return r.json().get("data")
+    return get_json(session, f"{API_BASE}/episodes/{episode_id}", timeout=20).get("data")
 
 
 def _normalize_official_page(payload: typing.Dict[str, typing.Any]) -> typing.List[typing.Any]:
@@ -94,54 +201,138 @@ def _normalize_official_page(payload: typing.Dict[str, typing.Any]) -> typing.Li
     return []
 
 
-def iter_official_episodes(token: str, series_id: int) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+def get_official_page(session: requests.Session, series_id: int, page: int) -> typing.Dict[str, typing.Any]:
+    """Fetch one page of a series' 'official' episode list."""
+    return get_json(session, f"{API_BASE}/series/{series_id}/episodes/official?page={page}", timeout=30)
+
+
+def _official_page_count(payload: typing.Dict[str, typing.Any]) -> int:
+    """Number of pages reported by an 'official' page's links, or 0 if it does not say."""
+    links = payload.get("links") or {}
+    try:
+        total_items = int(links["total_items"])
+        page_size = int(links["page_size"])
+    except (KeyError, TypeError, ValueError):
+        return 0
+    if page_size <= 0:
+        return 0
+    return -(-total_items // page_size)
+
+
+def _episode_id(item: typing.Any) -> typing.Optional[int]:
+    """Episode ID from an ID-like list entry (int or numeric string), or None."""
+    if isinstance(item, int):
+        return item
+    if isinstance(item, str):
+        try:
+            return int(item)
+        except ValueError:
+            return None
+    return None
+
+
+def _hydrate_episode(session: requests.Session, episode_id: int) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """Fetch an episode by ID, returning None on any failure so paging can continue."""
+    try:
+        return get_episode(session, episode_id)
+    except Exception:
+        return None
+
+
+def iter_official_episodes(session: requests.Session, series_id: int) -> typing.Iterator[typing.Dict[str, typing.Any]]:
     """
     Iterate 'official' episodes for a series, yielding full episode dicts.
     Handles pages where items may be dicts or bare IDs by hydrating IDs via /episodes/{id}.
+    Pages are still walked through links.next, but when the first page reports the
+    total, the rest are requested up front on a thread pool so their round trips overlap.
+    IDs are hydrated on the same pool.
     """
-    headers = {"Authorization": f"Bearer {token}"}
-    page = 0
-    while True:
-        url = f"{API_BASE}/series/{series_id}/episodes/official?page={page}"
-        r = requests.get(url, headers=headers, timeout=30)
-        r.raise_for_status()
-        payload = r.json()
-
-        items = _normalize_official_page(payload)
-        if not items:
-            break
-
-        for item in items:
-            if isinstance(item, dict):
-                yield item
-            else:
-                # Hydrate ID-like entries
-                ep_id: typing.Optional[int] = None
-                if isinstance(item, int):
-                    ep_id = item
-                elif isinstance(item, str):
-                    try:
-                        ep_id = int(item)
-                    except ValueError:
-                        ep_id = None
-                if ep_id is not None:
-                    try:
-                        ep = get_episode(token, ep_id)
-                        if ep:
-                            yield ep
-                    except Exception:
-                        # Skip any hydration failures and continue
-                        continue
-
-        links = payload.get("links") or {}
-        next_page = links.get("next")
-        if next_page is None:
-            break
+    payload = get_official_page(session, series_id, 0)
+    executor = ThreadPoolExecutor(max_workers=PAGE_FETCH_THREADS)
+    prefetched = {
+        n: executor.submit(get_official_page, session, series_id, n)
+        for n in range(1, _official_page_count(payload))
+    }
+    try:
+        while True:
+            items = _normalize_official_page(payload)
+            if not items:
+                break
+
+            # Hydrate ID-like entries on the pool, all of a page's IDs at once,
+            # then yield everything in page order
+            entries: typing.List[typing.Any] = []
+            for item in items:
+                if isinstance(item, dict):
+                    entries.append(item)
+                else:
+                    ep_id = _episode_id(item)
+                    if ep_id is not None:
+                        entries.append(executor.submit(_hydrate_episode, session, ep_id))
+
+            for entry in entries:
+                if isinstance(entry, dict):
+                    yield entry
+                else:
+                    ep = entry.result()
+                    if ep:
+                        yield ep
+
+            links = payload.get("links") or {}
+            next_page = links.get("next")
+            if next_page is None:
+                break
+            try:
+                page = int(next_page)
+            except Exception:
+                # Defensive: if next is malformed, stop
+                break
+
+            future = prefetched.get(page)
+            payload = future.result() if future else get_official_page(session, series_id, page)
+    finally:
+        # Stopping early drops any pages that have not been fetched yet
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def build_airdate_index(
+    episodes: typing.Iterable[typing.Dict[str, typing.Any]],
+) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """
+    Map YYYY-MM-DD airdates to episodes.
+    When several episodes share an airdate, the first one listed wins.
+    """
+    index: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    for ep in episodes:
+        # Airdate can appear as "aired" or "firstAired"; take first 10 chars for safety.
+        fa_raw = ep.get("aired") or ep.get("firstAired") or ""
+        fa = str(fa_raw)[:10]
+        if fa:
+            index.setdefault(fa, ep)
+    return index
+
+
+def load_airdate_index(
+    session: requests.Session,
+    series_id: int,
+    refresh: bool = False,
+) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """
+    Return the airdate index for a series, paging the episode list at most once.
+    A cached index younger than CACHE_TTL is reused unless refresh is set.
+    """
+    cache_path = CACHE_DIR / f"{series_id}.json"
+    if not refresh:
         try:
-            page = int(next_page)
-        except Exception:
-            # Defensive: if next is malformed, stop
-            break
+            if time.time() - cache_path.stat().st_mtime < CACHE_TTL:
+                with cache_path.open(encoding="utf-8") as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    index = build_airdate_index(iter_official_episodes(session, series_id))
+    save_cache_json(cache_path, index)
+    return index
 
 
 def parse_airdate_from_filename(name: str) -> typing.Optional[str]:
@@ -161,46 +352,67 @@ def proposed_new_name(
     return f"{series_display} - S{season:02d}E{episode:02d} - {airdate}{ext}"
 
 
-def resolve_for_file(
+def plan_rename(
     p: pathlib.Path,
-    token: str,
-    series_id: int,
+    airdate_index: typing.Dict[str, typing.Dict[str, typing.Any]],
     series_display: str,
-    do_rename: bool,
-) -> None:
+) -> typing.Optional[typing.Tuple[pathlib.Path, pathlib.Path]]:
+    """Print the proposed new name for a file and return (old, new) paths, or None if it has no match."""
     airdate = parse_airdate_from_filename(p.name)
     if not airdate:
         print(f"[skip] {p.name} — no YYYY-MM-DD found")
-        return
+        return None
 
-    match: typing.Optional[typing.Dict[str, typing[Any]]] = None
-    for ep in iter_official_episodes(token, series_id):
-        # Airdate can appear as "aired" or "firstAired"; take first 10 chars for safety.
-        fa_raw = ep.get("aired") or ep.get("firstAired") or ""
-        fa = str(fa_raw)[:10]
-        if fa == airdate:
-            match = ep
-            break
+    match = airdate_index.get(airdate)
 
     if not match:
         print(f"[warn] {p.name} — no TheTVDB episode with airdate {airdate} found")
-        return
+        return None
 
     season_num = match.get("seasonNumber")
     ep_num = match.get("number") or match.get("episodeNumber")
     if season_num is None or ep_num is None:
         print(f"[warn] {p.name} — found episode for {airdate}, but missing season/episode numbers")
-        return
+        return None
 
     new_name = proposed_new_name(p, series_display, int(season_num), int(ep_num), airdate)
     print(f"{p.name}  ->  {new_name}   (S{int(season_num):02d}E{int(ep_num):02d})")
+    return p, p.with_name(new_name)
 
-    if do_rename:
-        try:
-            new_path = p.with_name(new_name)
-            p.rename(new_path)
-        except Exception as e:
-            print(f"[error] rename failed for {p.name}: {e}")
+
+def _rename(old: pathlib.Path, new: pathlib.Path) -> typing.Optional[Exception]:
+    """Rename a file, returning the error instead of raising it."""
+    try:
+        os.rename(old, new)
+    except Exception as e:
+        return e
+    return None
+
+
+def apply_renames(plan: typing.List[typing.Tuple[pathlib.Path, pathlib.Path]]) -> None:
+    """
+    Carry out planned (old, new) renames, overlapping them on a thread pool.
+    A rename whose target is claimed by another entry of the plan is skipped, since
+    the order the renames land in is not fixed and one file would overwrite another.
+    """
+    sources = {old for old, _ in plan}
+    claimed: typing.Set[pathlib.Path] = set()
+    safe: typing.List[typing.Tuple[pathlib.Path, pathlib.Path]] = []
+    for old, new in plan:
+        if new == old:
+            continue
+        if new in claimed or new in sources:
+            print(f"[warn] {old.name} — {new.name} is also the target or source of another rename, skipping")
+            continue
+        claimed.add(new)
+        safe.append((old, new))
+
+    with ThreadPoolExecutor(max_workers=RENAME_THREADS) as executor:
+        errors = list(executor.map(_rename, *zip(*safe))) if safe else []
+
+    for (old, _), error in zip(safe, errors):
+        if error is not None:
+            print(f"[error] rename failed for {old.name}: {error}")
 
 
 def main() -> None:
@@ -217,32 +429,58 @@ def main() -> None:
     parser.add_argument("--slug", default="120-minutes", help="TheTVDB series slug (default: 120-minutes)")
     parser.add_argument("--series", default="120 Minutes", help="Series name to use in the new filename")
     parser.add_argument("--rename", action="store_true", help="Actually rename files on disk")
+    parser.add_argument("--refresh", action="store_true", help="Re-fetch the episode list even if a cached copy is fresh")
     args = parser.parse_args()
 
+    # One session for the whole run, so every call reuses the same connection
+    session = make_session()
     try:
-        token = tvdb_login(apikey, pin)
+        token = get_token(session, apikey, pin)
     except Exception as e:
         print(f"[error] TVDB login failed: {e}", file=sys.stderr)
         sys.exit(2)
+    session.headers.update({"Authorization": f"Bearer {token}"})
 
     try:
-        series_id = get_series_id_by_slug(token, args.slug)
+        try:
+            series_id = get_series_id_by_slug(session, args.slug)
+        except requests.HTTPError as e:
+            # A cached token can stop working before it expires; log in afresh once
+            if e.response is None or e.response.status_code != 401:
+                raise
+            token = get_token(session, apikey, pin, refresh=True)
+            session.headers.update({"Authorization": f"Bearer {token}"})
+            series_id = get_series_id_by_slug(session, args.slug)
     except Exception as e:
         print(f"[error] Failed to resolve series slug '{args.slug}': {e}", file=sys.stderr)
         sys.exit(3)
 
+    try:
+        airdate_index = load_airdate_index(session, series_id, refresh=args.refresh)
+    except Exception as e:
+        print(f"[error] Failed to fetch episodes for series {series_id}: {e}", file=sys.stderr)
+        sys.exit(4)
+
     targets: typing.List[pathlib.Path] = []
     for raw in args.paths:
         path = pathlib.Path(raw)
         if path.is_dir():
-            for f in sorted(path.iterdir()):
-                if f.is_file():
-                    targets.append(f)
+            # File types come from the directory listing, so no per-entry stat is needed
+            with os.scandir(path) as it:
+                entries = [e for e in it if e.is_file()]
+            entries.sort(key=lambda e: e.name)
+            targets.extend(pathlib.Path(e.path) for e in entries)
         else:
             targets.append(path)
 
+    plan: typing.List[typing.Tuple[pathlib.Path, pathlib.Path]] = []
     for p in targets:
-        resolve_for_file(p, token, series_id, args.series, args.rename)
+        planned = plan_rename(p, airdate_index, args.series)
+        if planned:
+            plan.append(planned)
+
+    if args.rename:
+        apply_renames(plan)
 
 
 if __name__ == "__main__":